@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Batch entry point for the Hello IITK Auto Downloader.
+
+This script processes several courses and resource types in one run without
+interactive prompts, logging in only once.
+"""
+import argparse
+import sys
+from src.core.auth import Credentials, get_credentials_from_environment
+from src.core.batch_app import BatchApplication, BATCH_TYPES, load_batch_config
+from src.utils.config import DEFAULT_DOWNLOAD_WORKERS
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Process several Hello IITK courses without interactive prompts. "
+                    "Credentials are read from HELLOIITK_USERNAME and HELLOIITK_PASSWORD "
+                    "or from the config file."
+    )
+    parser.add_argument("--config", help="JSON file describing the jobs")
+    parser.add_argument("--courses", nargs="+", help="course IDs to process")
+    parser.add_argument("--types", nargs="+", choices=BATCH_TYPES, help="resource types to process")
+    parser.add_argument("--output-dir", help="directory to create course folders in")
+    parser.add_argument("--workers", type=int, help="number of files to download in parallel")
+    parser.add_argument("--sync", action="store_true", default=None,
+                        help="only download lectures that are new or changed since the last sync "
+                             "and only add new forum posts")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """
+    Run the Hello IITK batch application.
+    
+    Returns
+    -------
+    int
+        Exit code: 0 for success, 1 for failure
+    """
+    print("=" * 80)
+    print("Hello IITK Batch Downloader".center(80))
+    print("=" * 80)
+    
+    args = parse_args()
+    config = load_batch_config(args.config) if args.config else {}
+    
+    # Command line arguments take precedence over the config file
+    course_ids = args.courses or config.get("courses", [])
+    resource_types = args.types or config.get("types", [])
+    if not course_ids or not resource_types:
+        print("At least one course and one resource type are required.")
+        return 1
+        
+    credentials = get_credentials_from_environment()
+    if credentials is None and config.get("username") and config.get("password"):
+        credentials = Credentials(username=config["username"], password=config["password"])
+    if credentials is None:
+        print("No credentials found. Set HELLOIITK_USERNAME and HELLOIITK_PASSWORD.")
+        return 1
+    
+    try:
+        app = BatchApplication(
+            course_ids=course_ids,
+            resource_types=resource_types,
+            output_dir=args.output_dir or config.get("output_dir", "."),
+            max_workers=args.workers or config.get("workers", DEFAULT_DOWNLOAD_WORKERS),
+            sync=args.sync if args.sync is not None else config.get("sync", False)
+        )
+    except ValueError as e:
+        print(str(e))
+        return 1
+        
+    success = app.run(credentials)
+    
+    if success:
+        print("\nBatch processing completed successfully.")
+        return 0
+    else:
+        print("\nBatch processing encountered errors.")
+        return 1
+    
+    
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of the HttpDownloader copy loop against a local HTTP server.
+
+Downloads one file of random bytes from ``python -m http.server`` on
+localhost, once with the old 1 KiB ``iter_content`` loop (one write and
+one progress update per chunk) and once with HttpDownloader, and reports
+throughput and CPU time of both.
+
+Run it from the repository root:
+
+    python benchmarks/http_download.py --size 200 --runs 3
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from tqdm import tqdm
+
+from src.downloaders.base import DownloadItem, HttpDownloader
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Benchmark HTTP download throughput.")
+    parser.add_argument("--size", type=int, default=200, help="file size in MB")
+    parser.add_argument("--runs", type=int, default=3, help="downloads per path")
+    return parser.parse_args()
+
+
+def free_port() -> int:
+    """Get a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(directory: str, port: int) -> subprocess.Popen:
+    """
+    Serve a directory over HTTP in a separate process.
+    
+    The server runs in its own process so its CPU time is not counted
+    against the download.
+    
+    Parameters
+    ----------
+    directory : str
+        Directory to serve
+    port : int
+        Port to listen on
+        
+    Returns
+    -------
+    subprocess.Popen
+        The server process
+    """
+    server = subprocess.Popen(
+        [sys.executable, "-m", "http.server", str(port), "--bind", "127.0.0.1",
+         "--directory", directory],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError("HTTP server did not start")
+
+
+def old_download(url: str, file_name: str) -> None:
+    """Download a file with the previous 1 KiB chunk loop."""
+    response = requests.get(url, stream=True)
+    total_size = int(response.headers.get('Content-Length', 0))
+    with open(file_name, 'wb') as file:
+        with tqdm(total=total_size, unit='B', unit_scale=True, desc=file_name,
+                  ascii=True, leave=False) as progress_bar:
+            for chunk in response.iter_content(chunk_size=1024):
+                if chunk:
+                    file.write(chunk)
+                    progress_bar.update(len(chunk))
+
+
+def new_download(url: str, file_name: str) -> None:
+    """Download a file with HttpDownloader on a single connection."""
+    if not HttpDownloader(segments=1).download(DownloadItem(file_name, url)):
+        raise RuntimeError(f"download of {url} failed")
+
+
+def measure(download: Callable[[str, str], None], url: str, file_name: str,
+            expected_size: int) -> Tuple[float, float]:
+    """
+    Time one download.
+    
+    Returns
+    -------
+    Tuple[float, float]
+        Wall-clock seconds and CPU seconds of this process
+    """
+    if os.path.exists(file_name):
+        os.remove(file_name)
+    wall, cpu = time.perf_counter(), time.process_time()
+    download(url, file_name)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    if os.path.getsize(file_name) != expected_size:
+        raise RuntimeError(f"{file_name} has the wrong size")
+    return wall, cpu
+
+
+def main() -> int:
+    """
+    Run the benchmark.
+    
+    Returns
+    -------
+    int
+        Exit code: 0 for success, 1 for failure
+    """
+    args = parse_args()
+    size = args.size * 1000 * 1000
+    
+    with tempfile.TemporaryDirectory() as serve_dir, tempfile.TemporaryDirectory() as out_dir:
+        with open(os.path.join(serve_dir, "file.bin"), 'wb') as file:
+            file.write(os.urandom(size))
+        
+        port = free_port()
+        server = start_server(serve_dir, port)
+        url = f"http://127.0.0.1:{port}/file.bin"
+        os.chdir(out_dir)
+        
+        try:
+            for name, download in (("old 1 KiB loop", old_download), ("HttpDownloader", new_download)):
+                for run in range(1, args.runs + 1):
+                    wall, cpu = measure(download, url, "file.bin", size)
+                    print(f"{name:15s} run {run}: {args.size / wall:7.1f} MB/s  "
+                          f"wall {wall:6.2f} s  cpu {cpu:6.2f} s")
+        except RuntimeError as e:
+            print(str(e))
+            return 1
+        finally:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
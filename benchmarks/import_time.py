@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Startup import check for the entry-point scripts.
+
+Imports every entry point under ``python -X importtime`` and reports its
+cumulative import time. Exits with status 1 if any of them loads one of
+the heavy dependencies that are meant to be imported on first use, so it
+can guard against startup regressions in CI or a pre-commit hook.
+
+Run it from the repository root:
+
+    python benchmarks/import_time.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Set, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry points checked, as importable module names
+ENTRY_POINTS = ("download", "quiz_scraper", "forums_scraper", "batch")
+
+# Packages that must not be imported at startup
+LAZY_PACKAGES = ("youtube_dl", "tqdm", "bs4", "pdfkit", "PyInquirer", "pandas")
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Check entry-point import time and imported packages.")
+    parser.add_argument("--runs", type=int, default=5, help="imports per entry point (median is reported)")
+    return parser.parse_args()
+
+
+def import_once(module: str) -> Tuple[int, Set[str]]:
+    """
+    Import a module in a fresh interpreter under ``-X importtime``.
+    
+    Parameters
+    ----------
+    module : str
+        Module to import
+        
+    Returns
+    -------
+    Tuple[int, Set[str]]
+        Cumulative import time of the module in microseconds and the
+        top-level names of every module imported
+        
+    Raises
+    ------
+    RuntimeError
+        If the import fails
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+    
+    total = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (field.strip() for field in line.split("|"))
+        if not cumulative.isdigit():
+            continue
+        imported.add(name.split(".")[0])
+        if name == module:
+            total = int(cumulative)
+    return total, imported
+
+
+def main() -> int:
+    """
+    Run the check.
+    
+    Returns
+    -------
+    int
+        Exit code: 0 if no entry point imports a lazy package, 1 otherwise
+    """
+    args = parse_args()
+    failed = False
+    
+    for module in ENTRY_POINTS:
+        totals: List[int] = []
+        imported: Set[str] = set()
+        try:
+            for _ in range(max(1, args.runs)):
+                total, names = import_once(module)
+                totals.append(total)
+                imported |= names
+        except RuntimeError as e:
+            print(str(e))
+            failed = True
+            continue
+        
+        eager = sorted(imported.intersection(LAZY_PACKAGES))
+        status = f"imports {', '.join(eager)}" if eager else "ok"
+        print(f"{module:15s} {statistics.median(totals) / 1000:7.1f} ms  {status}")
+        failed = failed or bool(eager)
+    
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
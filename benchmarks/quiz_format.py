@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of HtmlFormatter.format_quiz_to_html on synthetic quizzes.
+
+Builds quizzes of every question type with shuffled solutions, formats
+them once with the previous implementation (a scan of all solutions per
+question and repeated string concatenation) and once with HtmlFormatter,
+checks that both produce the same HTML and reports the best time of each.
+
+Run it from the repository root:
+
+    python benchmarks/quiz_format.py --questions 500 5000 --runs 5
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.converters.html_formatter import HtmlFormatter
+
+
+QUESTION_TYPES = ['truefalse', 'multichoice', 'short_answer', 'long_answer', 'matching']
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Benchmark quiz HTML formatting.")
+    parser.add_argument("--questions", type=int, nargs='+', default=[500, 5000],
+                        help="number of questions per quiz")
+    parser.add_argument("--runs", type=int, default=5, help="formatting runs per quiz")
+    return parser.parse_args()
+
+
+def make_quiz(size: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Build a quiz in the shape returned by the API.
+    
+    Parameters
+    ----------
+    size : int
+        Number of questions
+    seed : int, optional
+        Random seed, by default 0
+    
+    Returns
+    -------
+    Dict[str, Any]
+        Quiz with questions of every type and their solutions, shuffled
+    """
+    rng = random.Random(seed)
+    questions = []
+    solutions = []
+    
+    for qid in range(size):
+        q_type = QUESTION_TYPES[qid % len(QUESTION_TYPES)]
+        question = {
+            'qid': qid,
+            'type': q_type,
+            'score': rng.randint(1, 5),
+            'negative_score': rng.randint(0, 2),
+            'title': f'<p>Question {qid}: find \\(x^{qid % 7}\\) in '
+                     f'<img src="/static/q{qid}.png"> below.</p>'
+        }
+        if q_type == 'multichoice':
+            question['options'] = [{'aid': aid, 'value': f'Option \\(a_{aid}\\)'} for aid in range(4)]
+            answer = [{'aid': aid} for aid in rng.sample(range(4), rng.randint(1, 2))]
+        elif q_type == 'truefalse':
+            answer = [{'aid': rng.randint(0, 1)}]
+        else:
+            answer = [f'answer {qid}']
+        questions.append(question)
+        solutions.append({'qid': qid, 'correctAnswer': answer})
+    
+    rng.shuffle(questions)
+    rng.shuffle(solutions)
+    return {'quiz': {'questions': questions}, 'correctSolutions': solutions}
+
+
+def old_format_quiz_to_html(quiz_data: Dict[str, Any]) -> str:
+    """Format a quiz with the previous implementation, without math pre-rendering."""
+    html = HtmlFormatter.get_html_header()
+    html += '<div>\n<h1>Questions</h1>\n<div>\n'
+    
+    has_solutions = quiz_data.get('correctSolutions') is not None
+    answers_html = '<hr>\n<hr>\n<div>\n<h1>Answers</h1>\n<hr>\n' if has_solutions else ''
+    
+    question_types = ['truefalse', 'multichoice', 'short_answer', 'long_answer']
+    qid_order = []
+    
+    for q_type in question_types:
+        questions = [q for q in quiz_data['quiz']['questions'] if q.get('type') == q_type]
+        
+        if questions:
+            section_title = {
+                'truefalse': 'True False',
+                'multichoice': 'Multiple Choice',
+                'short_answer': 'Short Answer',
+                'long_answer': 'Long Answer'
+            }.get(q_type, q_type.replace('_', ' ').title())
+            
+            html += f'<div>\n<h2>{section_title}</h2>\n<hr>\n'
+            if has_solutions:
+                answers_html += f'<div>\n<h2>{section_title}</h2>\n<hr>\n'
+            
+            for question in questions:
+                qid_order.append(question['qid'])
+                q_num = len(qid_order)
+                
+                html += (f'<div class="question">\n'
+                         f'<h4>Question: {q_num} | Score: {question["score"]} | '
+                         f'Negative Score: -{question["negative_score"]}</h4>\n'
+                         f'{HtmlFormatter.jax2tex(question.get("title"))}\n')
+                
+                if q_type == 'multichoice' and 'options' in question:
+                    html += '<ol>\n'
+                    for option in question['options']:
+                        html += f'<li>{HtmlFormatter.jax2tex(option["value"])}</li>\n'
+                    html += '</ol>\n'
+                
+                html += '</div>\n'
+                
+                if has_solutions:
+                    answers_html += f'<h4>Answer: {q_num}</h4>\n'
+                    
+                    for sol in quiz_data['correctSolutions']:
+                        if sol.get('qid') == question['qid']:
+                            if q_type == 'truefalse':
+                                answer = sol.get('correctAnswer', [])[0].get('aid', None)
+                                if answer == 1:
+                                    answers_html += '<h5 class="answer">True</h5>\n'
+                                elif answer == 0:
+                                    answers_html += '<h5 class="answer">False</h5>\n'
+                                else:
+                                    answers_html += f'<h5 class="answer">{answer}</h5>\n'
+                            
+                            elif q_type == 'multichoice':
+                                answer_ids = [a.get('aid') for a in sol.get('correctAnswer', [])]
+                                
+                                for i, option in enumerate(question['options']):
+                                    if option['aid'] in answer_ids:
+                                        answers_html += (f'<h5 class="answer">{i+1}. '
+                                                         f'{HtmlFormatter.jax2tex(option["value"])}</h5>\n')
+                            
+                            elif q_type == 'short_answer':
+                                for a in sol.get('correctAnswer', []):
+                                    answers_html += f'<h5 class="answer">{a}</h5>\n'
+                            
+                            break
+            
+            html += '</div>\n'
+            if has_solutions:
+                answers_html += '</div>\n'
+    
+    other_questions = [q for q in quiz_data['quiz']['questions']
+                       if q.get('type') not in question_types]
+    
+    if other_questions:
+        html += '<div>\n<h2>Other Types</h2>\n<hr>\n'
+        
+        for question in other_questions:
+            qid_order.append(question['qid'])
+            q_num = len(qid_order)
+            
+            html += (f'<h4>Question: {q_num} | Score: {question["score"]} | '
+                     f'Negative Score: -{question["negative_score"]}</h4>\n'
+                     f'{HtmlFormatter.jax2tex(question.get("title"))}\n')
+        
+        html += '</div>\n'
+    
+    html += '</div>\n'
+    if has_solutions:
+        html += answers_html
+    html += '</body>\n</html>'
+    return html
+
+
+def best_time(format_quiz: Callable[[Dict[str, Any]], str], quiz: Dict[str, Any],
+              runs: int) -> float:
+    """Get the best wall-clock time in milliseconds of formatting a quiz."""
+    times: List[float] = []
+    for _ in range(max(1, runs)):
+        start = time.perf_counter()
+        format_quiz(quiz)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> int:
+    """
+    Run the benchmark.
+    
+    Returns
+    -------
+    int
+        Exit code: 0 for success, 1 if the two implementations disagree
+    """
+    args = parse_args()
+    
+    for size in args.questions:
+        quiz = make_quiz(size)
+        if old_format_quiz_to_html(quiz) != HtmlFormatter.format_quiz_to_html(quiz):
+            print(f"{size} questions: output differs from the previous implementation")
+            return 1
+        
+        old = best_time(old_format_quiz_to_html, quiz, args.runs)
+        new = best_time(HtmlFormatter.format_quiz_to_html, quiz, args.runs)
+        print(f"{size:6d} questions: previous {old:9.1f} ms  "
+              f"HtmlFormatter {new:7.1f} ms  ({old / new:5.1f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,10 +4,29 @@ Main entry point for the Hello IITK Auto Downloader.
 
 This script allows users to download videos and resources from Hello IITK courses.
 """
+import argparse
 import sys
 from src.core.downloader_app import DownloaderApplication
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Download videos and resources from Hello IITK courses.")
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="only download lectures that are new or changed since the last sync"
+    )
+    return parser.parse_args()
+
+
 def main() -> int:
     """
     Run the Hello IITK Auto Downloader application.
@@ -21,7 +40,9 @@ def main() -> int:
     print("Hello IITK Auto Downloader".center(80))
     print("=" * 80)
     
-    app = DownloaderApplication()
+    args = parse_args()
+    
+    app = DownloaderApplication(sync=args.sync)
     success = app.run()
     
     if success:
@@ -4,8 +4,34 @@ Main entry point for the Hello IITK Forums Scraper.
 
 This script allows users to fetch and save forum posts data from Hello IITK courses.
 """
+import argparse
 import sys
 from src.core.forums_app import ForumsApplication
+from src.scrapers.forums import ForumsScraper
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Fetch and save forum posts from Hello IITK courses.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only fetch posts newer than the last export and add them to the top of it"
+    )
+    parser.add_argument(
+        "--format",
+        choices=ForumsScraper.EXPORT_FORMATS,
+        default="csv",
+        help="export file format (default: csv)"
+    )
+    return parser.parse_args()
 
 
 def main() -> int:
@@ -21,7 +47,9 @@ def main() -> int:
     print("Hello IITK Forums Scraper".center(80))
     print("=" * 80)
     
-    app = ForumsApplication()
+    args = parse_args()
+    
+    app = ForumsApplication(incremental=args.incremental, export_format=args.format)
     success = app.run()
     
     if success:
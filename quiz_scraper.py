@@ -5,10 +5,29 @@ Main entry point for the Hello IITK Quiz & Assignment Scraper.
 This script allows users to fetch, format, and convert quiz and assignment data
 from Hello IITK courses.
 """
+import argparse
 import sys
 from src.core.quiz_app import QuizApplication
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Fetch and convert quizzes and assignments from Hello IITK courses.")
+    parser.add_argument(
+        "--combined-pdf",
+        action="store_true",
+        help="render all quizzes of the course into one PDF with bookmarks"
+    )
+    return parser.parse_args()
+
+
 def main() -> int:
     """
     Run the Hello IITK Quiz & Assignment Scraper application.
@@ -22,7 +41,9 @@ def main() -> int:
     print("Hello IITK Quiz & Assignment Scraper".center(80))
     print("=" * 80)
     
-    app = QuizApplication()
+    args = parse_args()
+    
+    app = QuizApplication(combined_pdf=args.combined_pdf)
     success = app.run()
     
     if success:
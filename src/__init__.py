@@ -1,5 +1,15 @@
 """
 Hello IITK Auto Downloader Main Package.
 """
-from src.core.auth import Authenticator, Credentials
-from src.core.course import Course, CourseManager
\ No newline at end of file
+from src.utils.lazy import lazy_getattr
+
+# Imported on first access, so entry points only load what they use
+_EXPORTS = {
+    'Authenticator': 'src.core.auth',
+    'Credentials': 'src.core.auth',
+    'Course': 'src.core.course',
+    'CourseManager': 'src.core.course',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
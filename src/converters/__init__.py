@@ -1,5 +1,13 @@
 """
 Converters package for transforming data between formats.
 """
-from src.converters.html_formatter import HtmlFormatter
-from src.converters.pdf_converter import PdfConverter
\ No newline at end of file
+from src.utils.lazy import lazy_getattr
+
+_EXPORTS = {
+    'MathRenderer': 'src.converters.math_renderer',
+    'HtmlFormatter': 'src.converters.html_formatter',
+    'PdfConverter': 'src.converters.pdf_converter',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
@@ -1,7 +1,12 @@
 """
 HTML formatter for quiz and assignment data.
 """
-from typing import Dict, Any, Optional
+import re
+from html import escape
+from typing import Dict, Any, List, Optional
+
+from src.converters.math_renderer import MathRenderer
+from src.utils.config import BASE_URL
 
 
 class HtmlFormatter:
@@ -9,15 +14,29 @@ class HtmlFormatter:
     Class for formatting quiz data as HTML.
     """
     
+    # Start of a root-relative `src` attribute in an <img> tag, up to the leading '/'.
+    # Earlier attributes are skipped as whole tokens, so a "src=" inside
+    # another attribute's quoted value is not mistaken for the attribute.
+    IMG_SRC_PATTERN = re.compile(
+        r'''(<img\b(?:[\s/]+[\w:.-]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?)*?'''
+        r'''[\s/]+src\s*=\s*["']?)(?=/)''',
+        re.IGNORECASE
+    )
+    
     @staticmethod
-    def jax2tex(text: str) -> str:
+    def jax2tex(text: str, prerender_math: bool = False) -> str:
         """
         Convert MathJax notation to TeX for proper rendering.
         
+        Relative image sources are made absolute so they load in the PDF.
+        
         Parameters
         ----------
         text : str
             Text containing MathJax
+        prerender_math : bool, optional
+            Also render the math of this fragment to static images,
+            by default False
             
         Returns
         -------
@@ -27,21 +46,19 @@ class HtmlFormatter:
         if text is None:
             return ""
             
-        text = '$'.join(('$'.join(text.split('\\('))).split('\\)'))
+        text = text.replace('\\(', '$').replace('\\)', '$')
         
         # Handle images in text
         if '<img' in text:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(text, 'html.parser')
-            for img in soup.find_all('img'):
-                if img['src'].startswith('/'):
-                    img['src'] = 'https://hello.iitk.ac.in' + img['src']
-            text = str(soup)
+            text = HtmlFormatter.IMG_SRC_PATTERN.sub(rf'\g<1>{BASE_URL}', text)
+            
+        if prerender_math:
+            text = MathRenderer.render_html(text)
             
         return text
     
     @staticmethod
-    def get_html_header(title: str = "Quizzes") -> str:
+    def get_html_header(title: str = "Quizzes", mathjax: bool = True) -> str:
         """
         Generate HTML header with necessary styling and scripts.
         
@@ -49,12 +66,20 @@ class HtmlFormatter:
         ----------
         title : str, optional
             Page title, by default "Quizzes"
+        mathjax : bool, optional
+            Include the MathJax scripts, by default True. Not needed
+            when math is pre-rendered.
             
         Returns
         -------
         str
             HTML header
         """
+        scripts = f"""
+<script type='text/x-mathjax-config'>MathJax.Hub.Config({{tex2jax: {{inlineMath: [['$','$'], ['\\\\(','\\\\)']]}},'
+    'config: ['MMLorHTML.js'],extensions: ['mml2jax.js','tex2math.js'],jax: ['input/MathML','input/TeX', 'output/HTML-CSS']}});</script>
+<script type="text/javascript" src="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.0/MathJax.js?config=TeX-AMS-MML_HTMLorMML"></script>""" if mathjax else ""
+        
         return f"""
 <!DOCTYPE html>
 <html lang="en">
@@ -62,10 +87,7 @@ class HtmlFormatter:
 <meta charset="UTF-8">
 <meta http-equiv="X-UA-Compatible" content="IE=edge">
 <meta name="viewport" content="width=device-width initial-scale=1.0">
-<title>{title}</title>
-<script type='text/x-mathjax-config'>MathJax.Hub.Config({{tex2jax: {{inlineMath: [['$','$'], ['\\\\(','\\\\)']]}},'
-    'config: ['MMLorHTML.js'],extensions: ['mml2jax.js','tex2math.js'],jax: ['input/MathML','input/TeX', 'output/HTML-CSS']}});</script>
-<script type="text/javascript" src="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.0/MathJax.js?config=TeX-AMS-MML_HTMLorMML"></script>
+<title>{title}</title>{scripts}
 <style>
     body {{ 
         font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
@@ -86,7 +108,8 @@ class HtmlFormatter:
 """
         
     @staticmethod
-    def format_quiz_to_html(quiz_data: Dict[str, Any]) -> str:
+    def format_quiz_to_html(quiz_data: Dict[str, Any], prerender_math: bool = False,
+                            title: Optional[str] = None) -> str:
         """
         Format quiz data as HTML.
         
@@ -94,6 +117,12 @@ class HtmlFormatter:
         ----------
         quiz_data : Dict[str, Any]
             Quiz data from the API
+        prerender_math : bool, optional
+            Render math to static SVG images instead of loading MathJax,
+            by default False. Requires the ziamath package.
+        title : Optional[str], optional
+            Quiz title shown as the page heading, by default None (no heading).
+            Gives each quiz its own bookmark in a combined PDF.
             
         Returns
         -------
@@ -103,22 +132,40 @@ class HtmlFormatter:
         if not quiz_data or 'quiz' not in quiz_data or 'questions' not in quiz_data['quiz']:
             return "<h2>No quiz data available</h2>"
             
-        html = HtmlFormatter.get_html_header()
+        if title:
+            title = escape(title)
+            header = HtmlFormatter.get_html_header(title, mathjax=not prerender_math)
+            header += f'<h1>{title}</h1>\n'
+        else:
+            header = HtmlFormatter.get_html_header(mathjax=not prerender_math)
         
-        # Start with questions section
-        html += '<div>\n<h1>Questions</h1>\n<div>\n'
+        # Both sections are built as lists of fragments and joined once
+        parts = [header, '<div>\n<h1>Questions</h1>\n<div>\n']
         
-        # Check if solutions are available
+        # Check if solutions are available; index them by question once
         has_solutions = quiz_data.get('correctSolutions') is not None
-        answers_html = '<hr>\n<hr>\n<div>\n<h1>Answers</h1>\n<hr>\n' if has_solutions else ''
+        answers = ['<hr>\n<hr>\n<div>\n<h1>Answers</h1>\n<hr>\n'] if has_solutions else []
+        solutions: Dict[Any, Dict[str, Any]] = {}
+        if has_solutions:
+            for sol in quiz_data['correctSolutions']:
+                solutions.setdefault(sol.get('qid'), sol)
         
-        # Process questions by type
+        # Group questions by type in a single pass
         question_types = ['truefalse', 'multichoice', 'short_answer', 'long_answer']
-        qid_order = []
+        questions_by_type: Dict[str, List[Dict[str, Any]]] = {q_type: [] for q_type in question_types}
+        other_questions = []
+        for question in quiz_data['quiz']['questions']:
+            q_type = question.get('type')
+            if q_type in questions_by_type:
+                questions_by_type[q_type].append(question)
+            else:
+                other_questions.append(question)
+        
+        q_num = 0
         
         # Process each type of question
         for q_type in question_types:
-            questions = [q for q in quiz_data['quiz']['questions'] if q.get('type') == q_type]
+            questions = questions_by_type[q_type]
             
             if questions:
                 # Add section header for this question type
@@ -129,88 +176,82 @@ class HtmlFormatter:
                     'long_answer': 'Long Answer'
                 }.get(q_type, q_type.replace('_', ' ').title())
                 
-                html += f'<div>\n<h2>{section_title}</h2>\n<hr>\n'
+                parts.append(f'<div>\n<h2>{section_title}</h2>\n<hr>\n')
                 if has_solutions:
-                    answers_html += f'<div>\n<h2>{section_title}</h2>\n<hr>\n'
+                    answers.append(f'<div>\n<h2>{section_title}</h2>\n<hr>\n')
                 
                 # Process each question
                 for question in questions:
-                    qid_order.append(question['qid'])
-                    q_num = len(qid_order)
+                    q_num += 1
                     
                     # Add question
-                    html += (f'<div class="question">\n'
-                            f'<h4>Question: {q_num} | Score: {question["score"]} | '
-                            f'Negative Score: -{question["negative_score"]}</h4>\n'
-                            f'{HtmlFormatter.jax2tex(question.get("title"))}\n')
+                    parts.append(f'<div class="question">\n'
+                                 f'<h4>Question: {q_num} | Score: {question["score"]} | '
+                                 f'Negative Score: -{question["negative_score"]}</h4>\n'
+                                 f'{HtmlFormatter.jax2tex(question.get("title"), prerender_math)}\n')
                     
                     # Add options for multiple choice
                     if q_type == 'multichoice' and 'options' in question:
-                        html += '<ol>\n'
+                        parts.append('<ol>\n')
                         for option in question['options']:
-                            html += f'<li>{HtmlFormatter.jax2tex(option["value"])}</li>\n'
-                        html += '</ol>\n'
+                            parts.append(f'<li>{HtmlFormatter.jax2tex(option["value"], prerender_math)}</li>\n')
+                        parts.append('</ol>\n')
                     
-                    html += '</div>\n'
+                    parts.append('</div>\n')
                     
                     # Add answer if available
                     if has_solutions:
-                        answers_html += f'<h4>Answer: {q_num}</h4>\n'
+                        answers.append(f'<h4>Answer: {q_num}</h4>\n')
                         
-                        for sol in quiz_data['correctSolutions']:
-                            if sol.get('qid') == question['qid']:
-                                if q_type == 'truefalse':
-                                    answer = sol.get('correctAnswer', [])[0].get('aid', None)
-                                    if answer == 1:
-                                        answers_html += '<h5 class="answer">True</h5>\n'
-                                    elif answer == 0:
-                                        answers_html += '<h5 class="answer">False</h5>\n'
-                                    else:
-                                        answers_html += f'<h5 class="answer">{answer}</h5>\n'
-                                        
-                                elif q_type == 'multichoice':
-                                    answer_ids = [a.get('aid') for a in sol.get('correctAnswer', [])]
+                        sol = solutions.get(question['qid'])
+                        if sol is not None:
+                            if q_type == 'truefalse':
+                                answer = sol.get('correctAnswer', [])[0].get('aid', None)
+                                if answer == 1:
+                                    answers.append('<h5 class="answer">True</h5>\n')
+                                elif answer == 0:
+                                    answers.append('<h5 class="answer">False</h5>\n')
+                                else:
+                                    answers.append(f'<h5 class="answer">{answer}</h5>\n')
                                     
-                                    for i, option in enumerate(question['options']):
-                                        if option['aid'] in answer_ids:
-                                            answers_html += (f'<h5 class="answer">{i+1}. '
-                                                           f'{HtmlFormatter.jax2tex(option["value"])}</h5>\n')
-                                            
-                                elif q_type == 'short_answer':
-                                    for a in sol.get('correctAnswer', []):
-                                        answers_html += f'<h5 class="answer">{a}</h5>\n'
+                            elif q_type == 'multichoice':
+                                answer_ids = {a.get('aid') for a in sol.get('correctAnswer', [])}
+                                
+                                for i, option in enumerate(question['options']):
+                                    if option['aid'] in answer_ids:
+                                        answers.append(f'<h5 class="answer">{i+1}. '
+                                                       f'{HtmlFormatter.jax2tex(option["value"], prerender_math)}</h5>\n')
                                         
-                                break
+                            elif q_type == 'short_answer':
+                                for a in sol.get('correctAnswer', []):
+                                    if prerender_math:
+                                        a = MathRenderer.render_html(str(a))
+                                    answers.append(f'<h5 class="answer">{a}</h5>\n')
                 
-                html += '</div>\n'
+                parts.append('</div>\n')
                 if has_solutions:
-                    answers_html += '</div>\n'
+                    answers.append('</div>\n')
         
         # Handle any remaining question types
-        other_questions = [q for q in quiz_data['quiz']['questions'] 
-                          if q.get('type') not in question_types]
-        
         if other_questions:
-            html += '<div>\n<h2>Other Types</h2>\n<hr>\n'
+            parts.append('<div>\n<h2>Other Types</h2>\n<hr>\n')
             
             for question in other_questions:
-                qid_order.append(question['qid'])
-                q_num = len(qid_order)
+                q_num += 1
                 
-                html += (f'<h4>Question: {q_num} | Score: {question["score"]} | '
-                        f'Negative Score: -{question["negative_score"]}</h4>\n'
-                        f'{HtmlFormatter.jax2tex(question.get("title"))}\n')
+                parts.append(f'<h4>Question: {q_num} | Score: {question["score"]} | '
+                             f'Negative Score: -{question["negative_score"]}</h4>\n'
+                             f'{HtmlFormatter.jax2tex(question.get("title"), prerender_math)}\n')
             
-            html += '</div>\n'
+            parts.append('</div>\n')
         
         # Close questions div
-        html += '</div>\n'
+        parts.append('</div>\n')
         
         # Add answers if available
-        if has_solutions:
-            html += answers_html
+        parts.extend(answers)
             
         # Close body and html
-        html += '</body>\n</html>'
+        parts.append('</body>\n</html>')
         
-        return html
\ No newline at end of file
+        return ''.join(parts)
\ No newline at end of file
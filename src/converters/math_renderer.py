@@ -0,0 +1,118 @@
+"""
+Offline math renderer that replaces TeX spans with SVG images.
+"""
+import base64
+import html
+import re
+from functools import lru_cache
+from typing import Match
+
+
+class MathRenderer:
+    """
+    Class for pre-rendering TeX math in HTML fragments to static SVG.
+    
+    Rendering happens in Python with ziamath, which draws every glyph as an
+    SVG path, so the generated pages need neither MathJax, fonts nor network
+    access, and wkhtmltopdf does not have to wait for JavaScript before
+    printing. Each formula is embedded as an ``<img>`` with an SVG data URI,
+    which QtWebKit renders like any other image.
+    """
+    
+    # Display math first so `$$...$$` is not read as two inline spans. No span
+    # crosses a tag, and inline spans follow the TeX/pandoc rule that the
+    # opening `$` is followed and the closing `$` preceded by a non-space (and
+    # not followed by a digit), so a lone price like "$5" is left alone.
+    MATH_PATTERN = re.compile(
+        r'\$\$(?P<display>[^<>]+?)\$\$'
+        r'|\\\[(?P<bracket>[^<>]+?)\\\]'
+        r'|\$(?=[^\s$])(?P<inline>[^<>$]*?[^\s<>$])\$(?!\d)'
+    )
+    
+    # Formula size in CSS pixels, matching the page's body text
+    FONT_SIZE = 16
+    
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Check whether the ziamath package is installed.
+        
+        Returns
+        -------
+        bool
+            True if math can be pre-rendered
+        """
+        try:
+            import ziamath  # noqa: F401
+            return True
+        except ImportError:
+            return False
+    
+    @classmethod
+    def render_html(cls, text: str) -> str:
+        """
+        Replace every math span in an HTML fragment with an SVG image.
+        
+        Handles ``$...$`` (as produced by HtmlFormatter.jax2tex), ``$$...$$``
+        and ``\\[...\\]``. Spans that cannot be converted are left as they are.
+        
+        Parameters
+        ----------
+        text : str
+            HTML fragment containing TeX math, such as one question or option
+        
+        Returns
+        -------
+        str
+            HTML fragment with math rendered as SVG images
+        """
+        if not text or ('$' not in text and '\\[' not in text):
+            return text
+        
+        def replace(match: Match) -> str:
+            inline = match.group('inline') is not None
+            tex = match.group('inline') if inline else match.group('display') or match.group('bracket')
+            try:
+                return cls._render(html.unescape(tex).strip(), inline)
+            except Exception:
+                return match.group(0)
+        
+        return cls.MATH_PATTERN.sub(replace, text)
+    
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _render(cls, tex: str, inline: bool) -> str:
+        """
+        Render one formula as an ``<img>`` tag, reusing repeated formulas.
+
+        Parameters
+        ----------
+        tex : str
+            TeX source of the formula
+        inline : bool
+            Render in text style on the text baseline, else as a centered block
+        
+        Returns
+        -------
+        str
+            The image tag
+        """
+        import ziamath
+        
+        # SVG 1.1 output without <symbol>/<use>, for QtWebKit
+        ziamath.config.svg2 = False
+        svg = ziamath.Latex(tex, size=cls.FONT_SIZE, inline=inline).svg()
+        
+        # The viewBox starts at minus the ascent, so whatever lies below
+        # its end is the descent to shift under the baseline
+        _, min_y, _, height = (float(v) for v in
+                               re.search(r'viewBox="([^"]+)"', svg).group(1).split())
+        descent = max(0.0, min_y + height)
+        
+        source = base64.b64encode(svg.encode('utf-8')).decode('ascii')
+        alt = html.escape(tex, quote=True)
+        if inline:
+            return (f'<img class="math" alt="{alt}" style="vertical-align: -{descent:.1f}px" '
+                    f'src="data:image/svg+xml;base64,{source}">')
+        return (f'<div class="math-display" style="text-align: center">'
+                f'<img class="math" alt="{alt}" src="data:image/svg+xml;base64,{source}"></div>')
@@ -2,8 +2,7 @@
 PDF converter for HTML files.
 """
 import os
-from typing import Dict, Any, Optional
-import pdfkit
+from typing import Dict, Any, List, Optional
 
 from src.utils.config import DEFAULT_PDF_OPTIONS, CSS_FILE
 
@@ -61,6 +60,8 @@ class PdfConverter:
             pdf_path = os.path.splitext(html_path)[0] + ".pdf"
             
         try:
+            import pdfkit
+            
             # Check if CSS file exists and is accessible
             css = self.css_file if os.path.exists(self.css_file) else None
             
@@ -76,6 +77,52 @@ class PdfConverter:
         except Exception as e:
             raise RuntimeError(f"Failed to convert HTML to PDF: {str(e)}")
             
+    def convert_html_files(self, html_paths: List[str], pdf_path: str) -> str:
+        """
+        Convert several HTML files into one PDF with a single wkhtmltopdf run.
+        
+        Process startup, the stylesheet and any scripts are loaded once for
+        all files. The PDF gets an outline (bookmarks) built from the
+        headings of the pages.
+        
+        Parameters
+        ----------
+        html_paths : List[str]
+            Paths to the HTML files, in page order
+        pdf_path : str
+            Path for the combined PDF file
+            
+        Returns
+        -------
+        str
+            Path to the generated PDF file
+            
+        Raises
+        ------
+        FileNotFoundError
+            If one of the HTML files doesn't exist
+        RuntimeError
+            If the conversion fails
+        """
+        for html_path in html_paths:
+            if not os.path.exists(html_path):
+                raise FileNotFoundError(f"HTML file not found: {html_path}")
+                
+        options = dict(self.options)
+        options['outline'] = None
+        
+        # pdfkit can only inline CSS into a single file, so let wkhtmltopdf apply it to every page
+        if os.path.exists(self.css_file):
+            options['user-style-sheet'] = self.css_file
+            
+        try:
+            import pdfkit
+            
+            pdfkit.from_file(html_paths, pdf_path, options=options)
+            return pdf_path
+        except Exception as e:
+            raise RuntimeError(f"Failed to convert HTML files to PDF: {str(e)}")
+            
     def convert_html_string(self, html_content: str, output_path: str) -> str:
         """
         Convert HTML content string to PDF.
@@ -98,6 +145,8 @@ class PdfConverter:
             If the conversion fails
         """
         try:
+            import pdfkit
+            
             # Check if CSS file exists and is accessible
             css = self.css_file if os.path.exists(self.css_file) else None
             
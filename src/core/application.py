@@ -16,9 +16,17 @@ class Application:
     managing authentication, course selection, and other core functionality.
     """
     
-    def __init__(self):
-        """Initialize the application components."""
-        self.auth = Authenticator()
+    def __init__(self, auth: Optional[Authenticator] = None):
+        """
+        Initialize the application components.
+        
+        Parameters
+        ----------
+        auth : Optional[Authenticator], optional
+            Authenticator to use, e.g. one shared between applications,
+            by default None (a new one is created)
+        """
+        self.auth = auth or Authenticator()
         self.course_manager: Optional[CourseManager] = None
         self.selected_course: Optional[Course] = None
         
@@ -26,6 +34,10 @@ class Application:
         """
         Authenticate the user.
         
+        A session saved by an earlier run is reused if it is still valid
+        (and belongs to the user of `credentials`, if given); otherwise the
+        user logs in.
+        
         Parameters
         ----------
         credentials : Optional[Credentials], optional
@@ -36,6 +48,12 @@ class Application:
         bool
             True if authentication was successful
         """
+        if self.auth.restore_session(credentials.username if credentials else None):
+            # Keep the credentials so an expired session can be renewed
+            self.auth.credentials = credentials
+            print("Reusing the saved login session.")
+            return True
+            
         if credentials is None:
             credentials = get_credentials_from_user()
             
@@ -1,11 +1,16 @@
 """
 Authentication module for Hello IITK.
 """
+import json
+import os
+import threading
+import time
 import requests
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.utils.config import LOGIN_URL
+from src.utils.config import LOGIN_URL, SESSION_FILE, SESSION_CHECK_URL
+from src.utils.retry import RetryPolicy
 
 @dataclass
 class Credentials:
@@ -33,20 +38,41 @@ class Authenticator:
     Handles user authentication with Hello IITK platform.
     
     This class is responsible for initiating a session, logging in,
-    and maintaining authentication tokens.
+    and maintaining authentication tokens. The login cookies are saved to
+    `session_file` so later runs can reuse them instead of logging in again.
+    
+    Requests made on behalf of this user go through `retry_policy`, which
+    logs in again with the stored credentials when the tokens expire.
     """
     
-    def __init__(self):
-        """Initialize the authenticator with a new session."""
+    def __init__(self, session_file: Optional[str] = SESSION_FILE):
+        """
+        Initialize the authenticator with a new session.
+        
+        Parameters
+        ----------
+        session_file : Optional[str], optional
+            File the login cookies are saved to, by default SESSION_FILE.
+            None disables saving sessions.
+        """
         self.session = requests.Session()
+        self.session_file = session_file
+        self.credentials: Optional[Credentials] = None
         self.cookies: Dict[str, str] = {}
+        self.retry_policy = RetryPolicy(auth=self)
         self._is_authenticated = False
+        self._login_lock = threading.Lock()
         
     @property
     def is_authenticated(self) -> bool:
         """Check if the user is authenticated."""
         return self._is_authenticated and 'uid' in self.cookies and 'token' in self.cookies
     
+    @property
+    def user_id(self) -> Optional[str]:
+        """Get the uid of the logged-in user, if any."""
+        return self.cookies.get('uid') if self.is_authenticated else None
+    
     @property
     def headers(self) -> Dict[str, str]:
         """Get authentication headers for API requests."""
@@ -88,17 +114,188 @@ class Authenticator:
         
         if 'uid' in self.cookies and 'token' in self.cookies:
             self._is_authenticated = True
+            self.credentials = credentials
+            self._save_session(credentials.username)
             return True
         else:
             self.session.cookies.clear()
             self._is_authenticated = False
             raise AuthenticationError("Login failed. Please check your credentials.")
         
+    def relogin(self, failed_token: Optional[str] = None) -> bool:
+        """
+        Log in again with the stored credentials after the tokens expired.
+        
+        When several threads see the same expired token at once, only the
+        first one logs in; the others reuse its new tokens. Nothing happens
+        if the session turns out to be still valid (the request was refused
+        for another reason).
+        
+        Parameters
+        ----------
+        failed_token : Optional[str], optional
+            Token the rejected request was sent with, by default None
+            
+        Returns
+        -------
+        bool
+            True if new tokens are available
+        """
+        if self.credentials is None:
+            return False
+            
+        with self._login_lock:
+            if failed_token is not None and self.cookies.get('token') not in (None, failed_token):
+                return True
+            if self._session_is_valid():
+                return False
+                
+            print("Session expired, logging in again...")
+            self.session.cookies.clear()
+            try:
+                return self.login(self.credentials)
+            except (AuthenticationError, requests.RequestException) as e:
+                print(f"Authentication error: {str(e)}")
+                return False
+        
+    def restore_session(self, username: Optional[str] = None) -> bool:
+        """
+        Reuse the login cookies saved by an earlier run.
+        
+        The saved session is checked with a single ``HEAD`` request to
+        SESSION_CHECK_URL; a session that has expired is deleted.
+        
+        Parameters
+        ----------
+        username : Optional[str], optional
+            Only restore a session of this user, by default None (any user)
+            
+        Returns
+        -------
+        bool
+            True if the saved session is still valid and is now in use
+        """
+        if not self.session_file or not os.path.exists(self.session_file):
+            return False
+            
+        try:
+            with open(self.session_file, 'r') as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            return False
+            
+        if username is not None and saved.get('username') != username:
+            return False
+            
+        now = time.time()
+        cookies = saved.get('cookies', [])
+        if any(cookie.get('expires') is not None and cookie['expires'] <= now for cookie in cookies):
+            self._delete_session()
+            return False
+            
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/'),
+                expires=cookie.get('expires'), secure=cookie.get('secure', False)
+            )
+        self.cookies = self.session.cookies.get_dict()
+        self._is_authenticated = 'uid' in self.cookies and 'token' in self.cookies
+        
+        valid = self._session_is_valid()
+        if not valid:
+            self.session.cookies.clear()
+            self.cookies = {}
+            self._is_authenticated = False
+            self._delete_session()
+        return valid
+        
     def logout(self) -> None:
-        """Log out and clear session data."""
+        """Log out, clear session data and forget the saved session."""
         self.session.cookies.clear()
         self.cookies = {}
         self._is_authenticated = False
+        self._delete_session()
+        
+    def _session_is_valid(self) -> bool:
+        """
+        Check the current tokens with one ``HEAD`` request to SESSION_CHECK_URL.
+        
+        Only the status matters, so the page itself is never downloaded.
+        
+        Returns
+        -------
+        bool
+            True if the server still accepts the session
+        """
+        if not self.is_authenticated:
+            return False
+        try:
+            # Logged-out users are redirected to the login page
+            response = self.session.head(SESSION_CHECK_URL, allow_redirects=False)
+            return response.status_code == 200
+        except requests.RequestException:
+            return False
+            
+    def _save_session(self, username: str) -> None:
+        """
+        Save the login cookies to `session_file`, readable by the owner only.
+        
+        Parameters
+        ----------
+        username : str
+            User the session belongs to
+        """
+        if not self.session_file:
+            return
+            
+        cookies: List[Dict[str, Any]] = [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'expires': cookie.expires,
+                'secure': cookie.secure
+            }
+            for cookie in self.session.cookies
+        ]
+        
+        try:
+            os.makedirs(os.path.dirname(self.session_file), mode=0o700, exist_ok=True)
+            tmp_path = f"{self.session_file}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as file:
+                json.dump({'username': username, 'saved_at': time.time(), 'cookies': cookies}, file)
+            os.replace(tmp_path, self.session_file)
+        except OSError as e:
+            print(f"Could not save the login session: {str(e)}")
+            
+    def _delete_session(self) -> None:
+        """Delete the saved session, if any."""
+        if self.session_file and os.path.exists(self.session_file):
+            try:
+                os.remove(self.session_file)
+            except OSError:
+                pass
+
+
+def get_credentials_from_environment() -> Optional[Credentials]:
+    """
+    Read login credentials from the environment.
+    
+    Uses the HELLOIITK_USERNAME and HELLOIITK_PASSWORD variables.
+    
+    Returns
+    -------
+    Optional[Credentials]
+        User credentials, or None if either variable is not set
+    """
+    username = os.environ.get('HELLOIITK_USERNAME')
+    password = os.environ.get('HELLOIITK_PASSWORD')
+    if not username or not password:
+        return None
+    return Credentials(username=username, password=password)
 
 
 def get_credentials_from_user() -> Credentials:
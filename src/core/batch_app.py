@@ -0,0 +1,181 @@
+"""
+Non-interactive batch application for Hello IITK Auto Downloader.
+"""
+import json
+import os
+from typing import Optional, List, Dict, Any, Tuple
+
+from src.core.application import Application
+from src.core.auth import Credentials
+from src.core.downloader_app import DownloaderApplication
+from src.core.forums_app import ForumsApplication
+from src.core.quiz_app import QuizApplication
+from src.utils.config import DEFAULT_DOWNLOAD_WORKERS
+from src.utils.filesystem import ensure_directory_exists
+
+
+# Resource types handled by the downloader application
+DOWNLOAD_TYPES = ["Videos", "Resources", "Supp"]
+
+# All resource types a batch job can ask for
+BATCH_TYPES = DOWNLOAD_TYPES + ["Quizzes", "Forums"]
+
+
+class BatchApplication(Application):
+    """
+    Application class that processes many courses without prompting.
+    
+    The user logs in once and the same authenticated session is shared by
+    every job. Download jobs also share a single download manager, and so
+    its worker count and connection pool.
+    """
+    
+    def __init__(self, course_ids: List[str], resource_types: List[str],
+                 output_dir: str = ".", max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                 sync: bool = False):
+        """
+        Initialize the batch application.
+        
+        Parameters
+        ----------
+        course_ids : List[str]
+            Courses to process
+        resource_types : List[str]
+            Resource types to process for every course, from BATCH_TYPES
+        output_dir : str, optional
+            Directory the course folders are created in, by default "."
+        max_workers : int, optional
+            Number of files to download in parallel, by default DEFAULT_DOWNLOAD_WORKERS
+        sync : bool, optional
+            Only download lectures that changed since the last sync and only
+            add forum posts newer than the last export, by default False
+        
+        Raises
+        ------
+        ValueError
+            If an unknown resource type is requested
+        """
+        super().__init__()
+        unknown = [t for t in resource_types if t not in BATCH_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(unknown)}")
+        
+        self.course_ids = course_ids
+        self.resource_types = resource_types
+        self.output_dir = ensure_directory_exists(output_dir)
+        
+        self.downloader = DownloaderApplication(max_workers=max_workers, sync=sync, auth=self.auth)
+        self.quiz_app = QuizApplication(auth=self.auth)
+        self.forums_app = ForumsApplication(auth=self.auth, incremental=sync)
+    
+    def run_job(self, course_id: str, resource_type: str) -> bool:
+        """
+        Process one resource type of one course.
+        
+        Parameters
+        ----------
+        course_id : str
+            Course to process
+        resource_type : str
+            Resource type to process
+        
+        Returns
+        -------
+        bool
+            True if the job completed successfully
+        """
+        course = self.course_manager.get_course_by_id(course_id)
+        if course is None:
+            print(f"Course with ID {course_id} not found.")
+            return False
+        
+        # Every job sets up its folders relative to the output directory
+        os.chdir(self.output_dir)
+        
+        if resource_type in DOWNLOAD_TYPES:
+            app = self.downloader
+            app.selected_course = course
+            app.resource_type = resource_type
+            return (app.initialize_scrapers() and
+                    app.setup_directories() and
+                    app.download_resources())
+        
+        if resource_type == "Quizzes":
+            app = self.quiz_app
+            app.selected_course = course
+            if not (app.initialize_scrapers() and app.setup_directories()):
+                return False
+            quiz_success = app.process_quizzes()
+            assignment_success = app.process_assignments()
+            return quiz_success and assignment_success
+        
+        app = self.forums_app
+        app.selected_course = course
+        return (app.initialize_scrapers() and
+                app.setup_directories(folder_name=course_id.upper()) and
+                app.process_forums())
+    
+    def run(self, credentials: Optional[Credentials] = None) -> bool:
+        """
+        Log in once and run every (course, resource type) job.
+        
+        Parameters
+        ----------
+        credentials : Optional[Credentials], optional
+            User credentials, if None will prompt user for input, by default None
+        
+        Returns
+        -------
+        bool
+            True if every job completed successfully
+        """
+        if not self.authenticate(credentials):
+            return False
+        
+        if not self.initialize_course_manager():
+            return False
+        
+        results: Dict[Tuple[str, str], bool] = {}
+        try:
+            for course_id in self.course_ids:
+                for resource_type in self.resource_types:
+                    print(f"\n--- {course_id}: {resource_type} ---")
+                    try:
+                        results[(course_id, resource_type)] = self.run_job(course_id, resource_type)
+                    except Exception as e:
+                        print(f"Error processing {resource_type} for {course_id}: {str(e)}")
+                        results[(course_id, resource_type)] = False
+        finally:
+            # The downloader's worker processes serve every job, so they stop here
+            self.downloader.download_manager.close()
+        
+        os.chdir(self.output_dir)
+        
+        failed = [job for job, success in results.items() if not success]
+        print(f"\nCompleted {len(results) - len(failed)} out of {len(results)} jobs.")
+        for course_id, resource_type in failed:
+            print(f"Failed: {course_id} {resource_type}")
+        
+        return not failed
+
+
+def load_batch_config(path: str) -> Dict[str, Any]:
+    """
+    Load a batch job description from a JSON file.
+    
+    The file may contain the keys ``courses`` (list of course IDs),
+    ``types`` (list of resource types), ``output_dir``, ``workers``,
+    ``sync``, ``username`` and ``password``.
+    
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file
+    
+    Returns
+    -------
+    Dict[str, Any]
+        The job description
+    """
+    with open(path, 'r') as file:
+        return json.load(file)
@@ -1,12 +1,15 @@
 """
 Course module for accessing and managing course information.
 """
+import json
+import os
+import time
 from typing import Dict, List, Optional, Any
-from bs4 import BeautifulSoup
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 from src.core.auth import Authenticator
-from src.utils.config import COURSES_URL
+from src.utils.cache import ResponseCache
+from src.utils.config import COURSES_URL, COURSE_CATALOG_FILE, COURSE_CATALOG_TTL
 
 
 @dataclass
@@ -34,9 +37,16 @@ class CourseManager:
     
     This class is responsible for retrieving course lists and
     providing course selection functionality.
+    
+    The parsed course list is saved per user and reused for `catalog_ttl`
+    seconds, so most runs neither download nor parse the course page.
+    Courses are indexed by ID. Looking up a course that is missing from a
+    saved list fetches the list again once, in case it was enrolled in
+    since the list was saved.
     """
     
-    def __init__(self, auth: Authenticator):
+    def __init__(self, auth: Authenticator, cache: Optional[ResponseCache] = None,
+                 catalog_ttl: float = COURSE_CATALOG_TTL):
         """
         Initialize with an authenticator.
         
@@ -44,9 +54,18 @@ class CourseManager:
         ----------
         auth : Authenticator
             An authenticated Authenticator instance
+        cache : Optional[ResponseCache], optional
+            Cache for the course list page, by default None (the default on-disk cache)
+        catalog_ttl : float, optional
+            Seconds a saved course list is used, by default COURSE_CATALOG_TTL.
+            A value of 0 always fetches the course page.
         """
         self.auth = auth
+        self.cache = cache if cache is not None else ResponseCache()
+        self.catalog_ttl = catalog_ttl
         self._courses: List[Course] = []
+        self._courses_by_id: Dict[str, Course] = {}
+        self._from_catalog = False
         
     @property
     def courses(self) -> List[Course]:
@@ -59,31 +78,141 @@ class CourseManager:
             List of available courses
         """
         if not self._courses:
+            self._load_courses()
+        return self._courses
+    
+    def _load_courses(self) -> None:
+        """
+        Load the saved course list, fetching it if it is missing or stale.
+        """
+        courses = self._load_catalog()
+        if courses is None:
             self._fetch_courses()
+            self._save_catalog()
+        else:
+            self._set_courses(courses)
+            self._from_catalog = True
+    
+    def refresh(self) -> List[Course]:
+        """
+        Fetch the course list again, ignoring the saved one.
+        
+        A cached course page is revalidated with the server rather than
+        reused.
+        
+        Returns
+        -------
+        List[Course]
+            List of available courses
+        """
+        self._fetch_courses(revalidate=True)
+        self._save_catalog()
         return self._courses
     
-    def _fetch_courses(self) -> None:
+    def _fetch_courses(self, revalidate: bool = False) -> None:
         """
         Fetch course information from IITK website.
+        
+        Parameters
+        ----------
+        revalidate : bool, optional
+            Ask the server even if the cached page is recent, by default False
         """
         if not self.auth.is_authenticated:
             raise ValueError("Authentication required to fetch courses")
         
-        response = self.auth.session.get(COURSES_URL)
-        if response.status_code != 200:
-            raise ConnectionError(f"Failed to fetch courses: HTTP {response.status_code}")
+        status_code, body = self.cache.fetch(self.auth.session, COURSES_URL, self.auth.user_id,
+                                             policy=self.auth.retry_policy, revalidate=revalidate)
+        if status_code != 200:
+            raise ConnectionError(f"Failed to fetch courses: HTTP {status_code}")
+        
+        self._set_courses(self._parse_courses(body))
+        self._from_catalog = False
+    
+    @staticmethod
+    def _parse_courses(body: str) -> List[Course]:
+        """
+        Parse the course list page.
+        
+        Only the ``span.field-content`` elements holding the courses are
+        built into a tree, with lxml when it is installed.
+        
+        Parameters
+        ----------
+        body : str
+            HTML of the course list page
+            
+        Returns
+        -------
+        List[Course]
+            Courses on the page
+        """
+        from bs4 import BeautifulSoup, SoupStrainer
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        self._courses = []
+        try:
+            import lxml  # noqa: F401
+            parser = 'lxml'
+        except ImportError:
+            parser = 'html.parser'
+            
+        course_spans = SoupStrainer('span', class_='field-content')
+        soup = BeautifulSoup(body, parser, parse_only=course_spans)
         
+        courses = []
         for course in soup.find_all('span', class_='field-content'):
             if course.h3 and course.a:
-                course_item = Course(
+                courses.append(Course(
                     name=course.h3.text,
                     instructor=course.a.text.strip().split('\n')[1],
                     course_id=course.a['href'].split('/')[-1][:-2]
-                )
-                self._courses.append(course_item)
+                ))
+        return courses
+    
+    def _set_courses(self, courses: List[Course]) -> None:
+        """Store the course list and index it by course ID."""
+        self._courses = courses
+        self._courses_by_id = {course.course_id: course for course in courses}
+    
+    def _catalog_path(self) -> str:
+        """Get the path of the saved course list of the logged-in user."""
+        return COURSE_CATALOG_FILE.format(self.auth.user_id)
+    
+    def _load_catalog(self) -> Optional[List[Course]]:
+        """
+        Load the saved course list if it is younger than `catalog_ttl`.
+        
+        Returns
+        -------
+        Optional[List[Course]]
+            The saved courses, None if there is no usable saved list
+        """
+        if self.catalog_ttl <= 0 or not self.auth.is_authenticated:
+            return None
+        try:
+            with open(self._catalog_path(), 'r') as file:
+                catalog = json.load(file)
+            if time.time() - catalog['stored_at'] >= self.catalog_ttl:
+                return None
+            return [Course(**course) for course in catalog['courses']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_catalog(self) -> None:
+        """Save the course list of the logged-in user."""
+        if self.catalog_ttl <= 0:
+            return
+        path = self._catalog_path()
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as file:
+                json.dump({
+                    'stored_at': time.time(),
+                    'courses': [asdict(course) for course in self._courses]
+                }, file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not save the course list: {str(e)}")
     
     def get_course_by_id(self, course_id: str) -> Optional[Course]:
         """
@@ -99,7 +228,11 @@ class CourseManager:
         Optional[Course]
             The course if found, None otherwise
         """
-        for course in self.courses:
-            if course.course_id == course_id:
-                return course
-        return None
\ No newline at end of file
+        if not self._courses:
+            self._load_courses()
+        course = self._courses_by_id.get(course_id)
+        if course is None and self._from_catalog:
+            # The saved list may predate enrolling in the course
+            self.refresh()
+            course = self._courses_by_id.get(course_id)
+        return course
\ No newline at end of file
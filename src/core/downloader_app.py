@@ -1,17 +1,24 @@
 """
 Downloader application for Hello IITK Auto Downloader.
 """
+import json
 import os
 from typing import Optional, List, Dict, Any
 
 from src.core.application import Application
+from src.core.auth import Authenticator
 from src.scrapers.lectures import LecturesScraper
 from src.downloaders.manager import DownloadManager
+from src.downloaders.manifest import DownloadManifest
 from src.utils.cli import select_resource_type
+from src.utils.config import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    MANIFEST_FILE_NAME,
+    SYNC_SNAPSHOT_FILE_NAME
+)
 from src.utils.filesystem import (
     setup_course_directory, 
-    setup_resource_directory, 
-    get_existing_files
+    setup_resource_directory
 )
 
 
@@ -23,10 +30,28 @@ class DownloaderApplication(Application):
     for selecting and downloading different types of resources.
     """
     
-    def __init__(self):
-        """Initialize the downloader application."""
-        super().__init__()
-        self.download_manager = DownloadManager()
+    def __init__(self, max_workers: int = DEFAULT_DOWNLOAD_WORKERS, sync: bool = False,
+                 auth: Optional[Authenticator] = None):
+        """
+        Initialize the downloader application.
+        
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of files to download in parallel, by default DEFAULT_DOWNLOAD_WORKERS
+        sync : bool, optional
+            Only download lectures that are new or changed since the last
+            successful sync, by default False
+        auth : Optional[Authenticator], optional
+            Authenticator to use, by default None (a new one is created)
+        """
+        super().__init__(auth)
+        self.sync = sync
+        self.download_manager = DownloadManager(
+            max_workers=max_workers,
+            session=self.auth.session,
+            retry_policy=self.auth.retry_policy
+        )
         self.lectures_scraper: Optional[LecturesScraper] = None
         self.resource_type: Optional[str] = None
         self.course_dir: Optional[str] = None
@@ -109,30 +134,68 @@ class DownloaderApplication(Application):
             
         try:
             print(f"Getting {self.resource_type} data...")
-            download_items = self.lectures_scraper.get_download_items(self.resource_type)
+            snapshot = self._load_sync_snapshot() if self.sync else None
+            download_items = self.lectures_scraper.get_download_items(self.resource_type, since=snapshot)
             
             if not download_items:
+                if snapshot is not None:
+                    print(f"No new or changed {self.resource_type} since the last sync.")
+                    self._save_sync_snapshot()
+                    return True
                 print(f"No {self.resource_type} found for course {self.selected_course.course_id}.")
                 return False
                 
             print(f"Found {len(download_items)} {self.resource_type} to download.")
             
-            # Get existing files to avoid re-downloading
-            existing_files = get_existing_files()
+            # The course manifest tells which files are already complete
+            manifest = DownloadManifest(os.path.join(self.course_dir, MANIFEST_FILE_NAME))
             
             # Download the files
             print(f"Downloading {self.resource_type} for {self.selected_course.course_id}. Press `Ctrl+C` to stop.")
-            results = self.download_manager.download_items(download_items, existing_files)
+            try:
+                results = self.download_manager.download_items(download_items, manifest=manifest)
+            finally:
+                manifest.close()
             
             # Count successful downloads
             success_count = sum(1 for success in results.values() if success)
             print(f"Successfully downloaded {success_count} out of {len(download_items)} {self.resource_type}.")
             
+            # Only move the snapshot forward once everything changed is on disk
+            if self.sync and success_count == len(download_items):
+                self._save_sync_snapshot()
+            
             return True
         except Exception as e:
             print(f"Error downloading resources: {str(e)}")
             return False
             
+    def _sync_snapshot_path(self) -> str:
+        """Get the path of the sync snapshot for the selected resource type."""
+        return os.path.join(self.course_dir, SYNC_SNAPSHOT_FILE_NAME.format(self.resource_type.lower()))
+    
+    def _load_sync_snapshot(self) -> Dict[str, str]:
+        """
+        Load the lecture snapshot saved by the last successful sync.
+        
+        Returns
+        -------
+        Dict[str, str]
+            Lecture fingerprints, empty if there was no previous sync
+        """
+        path = self._sync_snapshot_path()
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r') as file:
+            return json.load(file)
+    
+    def _save_sync_snapshot(self) -> None:
+        """Save the lecture snapshot of the current run."""
+        if self.resource_type == "Supp":
+            return
+        with open(self._sync_snapshot_path(), 'w') as file:
+            json.dump(self.lectures_scraper.snapshot, file, indent=2)
+    
     def run(self) -> bool:
         """
         Run the downloader application workflow.
@@ -158,5 +221,8 @@ class DownloaderApplication(Application):
         if not self.setup_directories():
             return False
             
-        # Download resources
-        return self.download_resources()
\ No newline at end of file
+        # Download resources, then stop the YouTube worker processes
+        try:
+            return self.download_resources()
+        finally:
+            self.download_manager.close()
\ No newline at end of file
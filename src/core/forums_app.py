@@ -1,11 +1,14 @@
 """
 Forums application for Hello IITK Auto Downloader.
 """
+import json
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 
 from src.core.application import Application
+from src.core.auth import Authenticator
 from src.scrapers.forums import ForumsScraper
+from src.utils.config import FORUMS_STATE_FILE_NAME, FORUMS_STATE_KEYS
 from src.utils.filesystem import setup_course_directory
 from src.utils.cli import get_folder_name
 
@@ -18,9 +21,24 @@ class ForumsApplication(Application):
     for fetching and saving forum posts data.
     """
     
-    def __init__(self):
-        """Initialize the forums application."""
-        super().__init__()
+    def __init__(self, auth: Optional[Authenticator] = None, incremental: bool = False,
+                 export_format: str = "csv"):
+        """
+        Initialize the forums application.
+        
+        Parameters
+        ----------
+        auth : Optional[Authenticator], optional
+            Authenticator to use, by default None (a new one is created)
+        incremental : bool, optional
+            Only fetch posts newer than the last export and add them to the
+            top of it, by default False
+        export_format : str, optional
+            Export file format, one of ForumsScraper.EXPORT_FORMATS, by default "csv"
+        """
+        super().__init__(auth)
+        self.incremental = incremental
+        self.export_format = export_format
         self.forums_scraper: Optional[ForumsScraper] = None
         self.course_dir: Optional[str] = None
         self.forums_dir: Optional[str] = None
@@ -45,10 +63,15 @@ class ForumsApplication(Application):
             print(f"Error initializing scrapers: {str(e)}")
             return False
             
-    def setup_directories(self) -> bool:
+    def setup_directories(self, folder_name: Optional[str] = None) -> bool:
         """
         Set up directories for forum data.
         
+        Parameters
+        ----------
+        folder_name : Optional[str], optional
+            Folder to save the forum data in, by default None (prompt the user)
+        
         Returns
         -------
         bool
@@ -56,7 +79,7 @@ class ForumsApplication(Application):
         """
         try:
             # Prompt for folder name
-            folder_name = get_folder_name() or self.selected_course.course_id.upper()
+            folder_name = folder_name or get_folder_name() or self.selected_course.course_id.upper()
             
             # Set up course directory
             self.course_dir = setup_course_directory(os.getcwd(), folder_name)
@@ -66,14 +89,14 @@ class ForumsApplication(Application):
             print(f"Error setting up directories: {str(e)}")
             return False
             
-    def process_forums(self, max_pages: int = 10) -> bool:
+    def process_forums(self, max_pages: Optional[int] = None) -> bool:
         """
         Process forum data - fetch and save.
         
         Parameters
         ----------
-        max_pages : int, optional
-            Maximum number of pages to fetch, by default 10
+        max_pages : Optional[int], optional
+            Maximum number of pages to fetch, by default None (all pages)
             
         Returns
         -------
@@ -85,26 +108,107 @@ class ForumsApplication(Application):
             return False
             
         try:
-            print(f"Fetching forum data for course {self.selected_course.course_id}...")
-            forums_data = self.forums_scraper.fetch_data(max_pages)
+            export_path = os.path.join(self.course_dir, f"forums.{self.export_format}")
+            newest = self._load_export_state()
+            prepend = self.incremental and bool(newest) and os.path.exists(export_path)
             
-            if not forums_data:
-                print(f"No forum posts found for course {self.selected_course.course_id}.")
-                return False
+            print(f"Fetching forum data for course {self.selected_course.course_id}...")
+            if prepend:
+                forums_data, found = self.forums_scraper.fetch_new_posts(newest, max_pages=max_pages)
+                if not found:
+                    # None of the remembered posts exists any more, so there
+                    # is no boundary: replace the export with what was fetched
+                    print("The last export no longer matches the forum; saving all posts.")
+                    prepend = False
+                elif not forums_data:
+                    print("No new forum posts since the last export.")
+                    return True
+                else:
+                    print(f"Found {len(forums_data)} new forum posts. Saving...")
+            else:
+                # Posts are written as pages arrive
+                forums_data = self.forums_scraper.iter_posts(max_pages=max_pages)
                 
-            print(f"Found {len(forums_data)} forum posts. Saving to CSV...")
-            csv_path = self.forums_scraper.save_to_csv(forums_data, self.course_dir)
+            newest_posts: List[Dict[str, Any]] = []
+            saved_path = self.forums_scraper.save_posts(
+                self._track_newest(forums_data, newest_posts), self.course_dir,
+                self.export_format, prepend=prepend)
             
-            if csv_path:
-                print(f"Forum data saved to {csv_path}")
+            if saved_path:
+                self._save_export_state(newest_posts, newest if prepend else [])
                 return True
             else:
+                print(f"No forum posts found for course {self.selected_course.course_id}.")
                 return False
                 
         except Exception as e:
             print(f"Error processing forum data: {str(e)}")
             return False
             
+    @staticmethod
+    def _track_newest(posts: Iterable[Dict[str, Any]],
+                      newest_posts: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Pass posts through, keeping the first FORUMS_STATE_KEYS of them.
+        
+        Parameters
+        ----------
+        posts : Iterable[Dict[str, Any]]
+            Posts being saved, newest first
+        newest_posts : List[Dict[str, Any]]
+            List the newest posts are appended to
+            
+        Yields
+        ------
+        Dict[str, Any]
+            The posts, unchanged
+        """
+        for post in posts:
+            if len(newest_posts) < FORUMS_STATE_KEYS:
+                newest_posts.append(post)
+            yield post
+            
+    def _export_state_path(self) -> str:
+        """Get the path of the export state for the selected format."""
+        return os.path.join(self.course_dir, FORUMS_STATE_FILE_NAME.format(self.export_format))
+    
+    def _load_export_state(self) -> List[str]:
+        """
+        Load the keys of the newest posts saved by the last export.
+        
+        Returns
+        -------
+        List[str]
+            Post keys, newest first, empty if there was no previous export
+        """
+        path = self._export_state_path()
+        if not os.path.exists(path):
+            return []
+        with open(path, 'r') as file:
+            state = json.load(file)
+        if state.get('course_id') != self.selected_course.course_id:
+            return []
+        return state.get('newest', [])
+    
+    def _save_export_state(self, posts: List[Dict[str, Any]], newest: List[str]) -> None:
+        """
+        Remember the newest exported posts.
+        
+        Parameters
+        ----------
+        posts : List[Dict[str, Any]]
+            Posts saved by this run, newest first
+        newest : List[str]
+            Post keys remembered from earlier runs
+        """
+        keys = [self.forums_scraper.post_key(post) for post in posts[:FORUMS_STATE_KEYS]]
+        state = {
+            'course_id': self.selected_course.course_id,
+            'newest': (keys + newest)[:FORUMS_STATE_KEYS]
+        }
+        with open(self._export_state_path(), 'w') as file:
+            json.dump(state, file, indent=2)
+            
     def run(self) -> bool:
         """
         Run the forums application workflow.
@@ -1,13 +1,18 @@
 """
 Quiz and Assignment application for Hello IITK Auto Downloader.
 """
+import asyncio
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 
 from src.core.application import Application
+from src.core.auth import Authenticator
 from src.scrapers.quiz_assignment import QuizAssignmentScraper
 from src.converters.html_formatter import HtmlFormatter
+from src.converters.math_renderer import MathRenderer
 from src.converters.pdf_converter import PdfConverter
+from src.utils.config import DEFAULT_PDF_WORKERS, PRERENDERED_PDF_OPTIONS
 from src.utils.filesystem import setup_course_directory
 
 
@@ -19,11 +24,35 @@ class QuizApplication(Application):
     for fetching, converting, and saving quiz and assignment data.
     """
     
-    def __init__(self):
-        """Initialize the quiz application."""
-        super().__init__()
+    def __init__(self, auth: Optional[Authenticator] = None,
+                 pdf_workers: int = DEFAULT_PDF_WORKERS,
+                 combined_pdf: bool = False):
+        """
+        Initialize the quiz application.
+        
+        Parameters
+        ----------
+        auth : Optional[Authenticator], optional
+            Authenticator to use, by default None (a new one is created)
+        pdf_workers : int, optional
+            Number of PDFs rendered in parallel, by default DEFAULT_PDF_WORKERS
+        combined_pdf : bool, optional
+            Render all quizzes of the course into one PDF with bookmarks,
+            in a single converter run, by default False (one PDF per quiz)
+        """
+        super().__init__(auth)
+        self.pdf_workers = max(1, pdf_workers)
+        self.combined_pdf = combined_pdf
+        self.quiz_results: Dict[str, bool] = {}
         self.quiz_scraper: Optional[QuizAssignmentScraper] = None
-        self.pdf_converter = PdfConverter()
+        
+        # Pre-rendered math needs no MathJax, so no JavaScript delay either
+        self.prerender_math = MathRenderer.is_available()
+        if self.prerender_math:
+            self.pdf_converter = PdfConverter(options=PRERENDERED_PDF_OPTIONS)
+        else:
+            print("ziamath is not installed; math will be rendered with MathJax.")
+            self.pdf_converter = PdfConverter()
         self.course_dir: Optional[str] = None
         self.quizzes_dir: Optional[str] = None
         
@@ -74,6 +103,8 @@ class QuizApplication(Application):
         """
         Process quiz data - fetch, convert to HTML and PDF.
         
+        Whether each quiz's PDF was created is recorded in `quiz_results`.
+        
         Returns
         -------
         bool
@@ -98,38 +129,106 @@ class QuizApplication(Application):
             print(f"Found {len(quizzes)} quizzes. Processing...")
             self.quiz_scraper.save_data_to_file(quizzes, "quizzes-summary.json")
             
-            for quiz in quizzes:
-                qid = quiz.get('qid')
-                if qid:
-                    # Fetch quiz details
-                    quiz_data = self.quiz_scraper.fetch_quiz_details(qid)
-                    
-                    # Get title for the quiz
-                    quiz_title = self._format_title(quiz_data.get('quiz', {}).get('title', 'No-Title'))
-                    
-                    # Save JSON data
-                    self.quiz_scraper.save_data_to_file(quiz_data, f"{quiz_title}.json")
-                    
-                    # Convert to HTML
-                    html_content = HtmlFormatter.format_quiz_to_html(quiz_data)
-                    
-                    # Save HTML file
-                    html_file = f"{quiz_title}.html"
-                    with open(html_file, 'w') as f:
-                        f.write(html_content)
-                    
-                    # Convert to PDF
+            # Fetch quiz details concurrently
+            quiz_ids = [quiz.get('qid') for quiz in quizzes if quiz.get('qid')]
+            all_quiz_data = asyncio.run(self.quiz_scraper.fetch_all_quiz_details_async(quiz_ids))
+            
+            if self.combined_pdf:
+                return self._process_quizzes_combined(all_quiz_data)
+            
+            # Render PDFs in a pool; each wkhtmltopdf run is its own process, so
+            # HTML for the next quiz is generated while earlier ones render
+            renders: Dict[str, Future] = {}
+            with ThreadPoolExecutor(max_workers=self.pdf_workers) as render_pool:
+                for quiz_data in all_quiz_data:
+                    if quiz_data:
+                        # Get title for the quiz
+                        quiz_title = self._format_title(quiz_data.get('quiz', {}).get('title', 'No-Title'))
+                        
+                        # Save JSON data
+                        self.quiz_scraper.save_data_to_file(quiz_data, f"{quiz_title}.json")
+                        
+                        # Convert to HTML and save it
+                        html_file = self._write_quiz_html(quiz_data, quiz_title)
+                        
+                        # Queue the PDF conversion
+                        renders[quiz_title] = render_pool.submit(self.pdf_converter.convert_html_file, html_file)
+                
+                self.quiz_results = {}
+                for quiz_title, render in renders.items():
                     try:
-                        self.pdf_converter.convert_html_file(html_file)
+                        render.result()
                         print(f"Successfully created {quiz_title}.pdf")
+                        self.quiz_results[quiz_title] = True
                     except Exception as pdf_err:
                         print(f"Error converting quiz to PDF: {str(pdf_err)}")
+                        self.quiz_results[quiz_title] = False
             
             return True
         except Exception as e:
             print(f"Error processing quizzes: {str(e)}")
             return False
             
+    def _process_quizzes_combined(self, all_quiz_data: List[Dict[str, Any]]) -> bool:
+        """
+        Save every quiz as JSON and HTML, then render one course PDF.
+        
+        Parameters
+        ----------
+        all_quiz_data : List[Dict[str, Any]]
+            Quiz details from the API
+            
+        Returns
+        -------
+        bool
+            True if the course PDF was created
+        """
+        html_files: Dict[str, str] = {}
+        for quiz_data in all_quiz_data:
+            if quiz_data:
+                quiz_title = self._format_title(quiz_data.get('quiz', {}).get('title', 'No-Title'))
+                self.quiz_scraper.save_data_to_file(quiz_data, f"{quiz_title}.json")
+                html_files[quiz_title] = self._write_quiz_html(quiz_data, quiz_title)
+                
+        pdf_file = f"{self.selected_course.course_id.upper()}-quizzes.pdf"
+        try:
+            self.pdf_converter.convert_html_files(list(html_files.values()), pdf_file)
+            print(f"Successfully created {pdf_file} with {len(html_files)} quizzes")
+            success = True
+        except Exception as pdf_err:
+            print(f"Error converting quizzes to PDF: {str(pdf_err)}")
+            success = False
+            
+        self.quiz_results = {quiz_title: success for quiz_title in html_files}
+        return success
+        
+    def _write_quiz_html(self, quiz_data: Dict[str, Any], quiz_title: str) -> str:
+        """
+        Format a quiz as HTML and save it.
+        
+        Parameters
+        ----------
+        quiz_data : Dict[str, Any]
+            Quiz details from the API
+        quiz_title : str
+            Formatted quiz title used for the file name
+            
+        Returns
+        -------
+        str
+            Path to the HTML file
+        """
+        html_content = HtmlFormatter.format_quiz_to_html(
+            quiz_data,
+            self.prerender_math,
+            title=quiz_data.get('quiz', {}).get('title')
+        )
+        
+        html_file = f"{quiz_title}.html"
+        with open(html_file, 'w') as f:
+            f.write(html_content)
+        return html_file
+        
     def process_assignments(self) -> bool:
         """
         Process assignment data - fetch and save.
@@ -159,7 +258,9 @@ class QuizApplication(Application):
             self.quiz_scraper.save_data_to_file(assignments, "assignments-summary.json")
             
             # Process each assignment
-            self.quiz_scraper.save_assignment_data(self.quizzes_dir)
+            if not self.quiz_scraper.save_assignment_data(self.quizzes_dir):
+                print(f"Some assignment data for course {self.selected_course.course_id} could not be saved.")
+                return False
             
             return True
         except Exception as e:
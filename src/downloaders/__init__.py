@@ -1,6 +1,17 @@
 """
 Downloaders package for handling different file download methods.
 """
-from src.downloaders.base import Downloader, HttpDownloader, DownloadItem
-from src.downloaders.youtube import YouTubeDownloader
-from src.downloaders.manager import DownloadManager
\ No newline at end of file
+from src.utils.lazy import lazy_getattr
+
+_EXPORTS = {
+    'Downloader': 'src.downloaders.base',
+    'HttpDownloader': 'src.downloaders.base',
+    'DownloadItem': 'src.downloaders.base',
+    'IncompleteDownloadError': 'src.downloaders.base',
+    'YouTubeDownloader': 'src.downloaders.youtube',
+    'DownloadManifest': 'src.downloaders.manifest',
+    'DownloadManager': 'src.downloaders.manager',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
@@ -1,11 +1,31 @@
 """
 Base downloader classes and interfaces.
 """
+import json
+import os
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Optional, Tuple
 import requests
-from tqdm import tqdm
+from urllib3.exceptions import HTTPError as Urllib3Error
+
+from src.utils.config import (
+    DEFAULT_DOWNLOAD_RETRIES,
+    DEFAULT_DOWNLOAD_SEGMENTS,
+    SEGMENTED_DOWNLOAD_THRESHOLD,
+    MIN_DOWNLOAD_CHUNK_SIZE,
+    MAX_DOWNLOAD_CHUNK_SIZE,
+    PROGRESS_UPDATE_INTERVAL
+)
+from src.utils.http import build_session
+from src.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from tqdm import tqdm
 
 
 @dataclass
@@ -19,9 +39,20 @@ class DownloadItem:
         Name to save the file as
     file_url : str
         URL to download the file from
+    etag : Optional[str]
+        ETag of the downloaded file, filled in by downloaders when the server sends one
+    size : Optional[int]
+        Expected size in bytes, filled in by `Downloader.preflight` when known
     """
     file_name: str
     file_url: str
+    etag: Optional[str] = None
+    size: Optional[int] = None
+
+
+class IncompleteDownloadError(IOError):
+    """Exception raised when a download ends before all bytes were received."""
+    pass
 
 
 class Downloader(ABC):
@@ -40,7 +71,7 @@ class Downloader(ABC):
         ----------
         item : DownloadItem
             The file details to download
-            
+        
         Returns
         -------
         bool
@@ -57,20 +88,102 @@ class Downloader(ABC):
         ----------
         item : DownloadItem
             The item to check
-            
+        
         Returns
         -------
         bool
             True if this downloader can handle the item
         """
         pass
+    
+    def preflight(self, items: List[DownloadItem]) -> List[DownloadItem]:
+        """
+        Inspect items before any of them is downloaded.
+        
+        Downloaders that can look up items cheaply override this to fill in
+        `DownloadItem.size` and to drop items that cannot be downloaded.
+        
+        Parameters
+        ----------
+        items : List[DownloadItem]
+            Items this downloader will handle
+        
+        Returns
+        -------
+        List[DownloadItem]
+            The items worth downloading
+        """
+        return items
+    
+    def close(self) -> None:
+        """Release resources such as worker processes; nothing by default."""
+        pass
 
 
 class HttpDownloader(Downloader):
     """
     Downloader implementation for HTTP downloads using requests library.
+    
+    Data is written to a ``.part`` file next to the target and renamed once
+    complete. If a download is interrupted, the next attempt resumes from
+    the size of the partial file with a ``Range`` request, validated with
+    ``If-Range`` against the ETag of the original response. Partial data
+    without an ETag cannot be validated and is downloaded again. A body the
+    server compresses anyway is saved decoded and is not resumed.
+    
+    Files of at least `segment_threshold` bytes served with
+    ``Accept-Ranges: bytes`` are split into byte ranges fetched over
+    several connections into a preallocated ``.seg`` file. The bytes
+    received per range are kept in a ``.seg.json`` file next to it, so an
+    interrupted segmented download of a file with an ETag resumes only its
+    unfinished ranges.
     """
     
+    PART_SUFFIX = ".part"
+    ETAG_SUFFIX = ".etag"
+    SEGMENT_SUFFIX = ".seg"
+    SEGMENT_STATE_SUFFIX = ".json"
+    
+    # Ask for the stored bytes: offsets, ranges and Content-Length must all
+    # count the same bytes, which a compressed transfer would break
+    REQUEST_HEADERS = {'Accept-Encoding': 'identity'}
+    
+    def __init__(self, max_retries: int = DEFAULT_DOWNLOAD_RETRIES,
+                 segments: int = DEFAULT_DOWNLOAD_SEGMENTS,
+                 segment_threshold: int = SEGMENTED_DOWNLOAD_THRESHOLD,
+                 chunk_size: Optional[int] = None,
+                 session: Optional[requests.Session] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Initialize the downloader.
+        
+        Parameters
+        ----------
+        max_retries : int, optional
+            Number of attempts per file before giving up, by default DEFAULT_DOWNLOAD_RETRIES
+        segments : int, optional
+            Number of connections used for large files, by default DEFAULT_DOWNLOAD_SEGMENTS.
+            A value of 1 disables segmented downloads.
+        segment_threshold : int, optional
+            Minimum file size in bytes for a segmented download,
+            by default SEGMENTED_DOWNLOAD_THRESHOLD
+        chunk_size : Optional[int], optional
+            Read buffer size in bytes, by default None (sized from the file length
+            between MIN_DOWNLOAD_CHUNK_SIZE and MAX_DOWNLOAD_CHUNK_SIZE)
+        session : Optional[requests.Session], optional
+            Session whose connection pool is reused for every download,
+            by default None (a pooled session is created)
+        retry_policy : Optional[RetryPolicy], optional
+            Policy every request is sent through, e.g. the authenticator's,
+            by default None (a policy without re-authentication)
+        """
+        self.max_retries = max(1, max_retries)
+        self.segments = max(1, segments)
+        self.segment_threshold = segment_threshold
+        self.chunk_size = chunk_size
+        self.session = session or build_session(pool_size=self.segments)
+        self.retry_policy = retry_policy or RetryPolicy()
+    
     def can_handle(self, item: DownloadItem) -> bool:
         """
         Check if this downloader can handle the given item.
@@ -81,7 +194,7 @@ class HttpDownloader(Downloader):
         ----------
         item : DownloadItem
             The item to check
-            
+        
         Returns
         -------
         bool
@@ -94,43 +207,560 @@ class HttpDownloader(Downloader):
     
     def download(self, item: DownloadItem) -> bool:
         """
-        Download a file via HTTP/HTTPS.
+        Download a file via HTTP/HTTPS, resuming partial downloads.
         
         Parameters
         ----------
         item : DownloadItem
             The file to download
-            
+        
         Returns
         -------
         bool
             True if download was successful, False otherwise
         """
-        try:
-            response = requests.get(item.file_url, stream=True)
+        from tqdm import tqdm
+        
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                return self._download_once(item)
+            except (requests.RequestException, IncompleteDownloadError) as e:
+                tqdm.write(f"Interrupted downloading {item.file_name} "
+                           f"(attempt {attempt}/{self.max_retries}): {str(e)}")
+            except Exception as e:
+                tqdm.write(f"Error downloading {item.file_name}: {str(e)}")
+                return False
+        
+        tqdm.write(f"Giving up on {item.file_name}, partial data kept for the next run.")
+        return False
+    
+    def _download_once(self, item: DownloadItem) -> bool:
+        """
+        Make a single download attempt, resuming from the partial file if any.
+        
+        Parameters
+        ----------
+        item : DownloadItem
+            The file to download
+        
+        Returns
+        -------
+        bool
+            True if the file was completed, False on a non-retryable HTTP error
+        
+        Raises
+        ------
+        requests.RequestException
+            If the connection fails
+        IncompleteDownloadError
+            If the server closed the stream early
+        """
+        from tqdm import tqdm
+        
+        part_path = item.file_name + self.PART_SUFFIX
+        etag_path = part_path + self.ETAG_SUFFIX
+        
+        # An unfinished segmented download carries on with its missing ranges,
+        # unless there is no validator to keep them to the same file version
+        state = self._read_segment_state(item.file_name)
+        if state is not None and state.get('etag'):
+            return self._download_segmented(item, state['size'], state['etag'])
+        if state is not None:
+            seg_path = item.file_name + self.SEGMENT_SUFFIX
+            self._discard_partial(seg_path, seg_path + self.SEGMENT_STATE_SUFFIX)
+        
+        # A file already at the target that we were asked to fetch may be
+        # truncated or outdated. It is kept only if the server reports
+        # exactly its size; otherwise it stays in place until a new copy
+        # has been downloaded to replace it.
+        if (os.path.exists(item.file_name) and not os.path.exists(part_path)
+                and self._matches_remote_size(item)):
+            tqdm.write(f"{item.file_name} is already complete.")
+            return True
+        
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        etag = self._read_etag(etag_path)
+        if offset > 0 and not etag:
+            # Without a validator a range could append another version's bytes
+            self._discard_partial(part_path, etag_path)
+            offset = 0
+        
+        headers = dict(self.REQUEST_HEADERS)
+        if offset > 0:
+            headers['Range'] = f"bytes={offset}-"
+            headers['If-Range'] = etag
+        
+        with self.retry_policy.request(self.session, item.file_url, stream=True,
+                                       headers=headers) as response:
+            if response.status_code == 416 and offset > 0:
+                # Nothing left to fetch if the partial file already has every byte
+                _, total_size = self._parse_content_range(response.headers.get('Content-Range'))
+                if total_size == offset:
+                    item.etag = self._read_etag(etag_path)
+                    self._finalize(part_path, etag_path, item.file_name)
+                    tqdm.write(f"Completed downloading {item.file_name}.")
+                    return True
+                self._discard_partial(part_path, etag_path)
+                return self._download_once(item)
             
-            if response.status_code != 200:
-                print(f"Failed to download {item.file_name}: HTTP {response.status_code}")
+            decode = False
+            if response.status_code == 206:
+                start, total_size = self._parse_content_range(response.headers.get('Content-Range'))
+                if start != offset or self._is_encoded(response):
+                    # Another range, or encoded bytes, cannot be appended
+                    self._discard_partial(part_path, etag_path)
+                    if offset == 0:
+                        raise IncompleteDownloadError("server sent an unusable partial response")
+                    return self._download_once(item)
+                mode = 'ab'
+            elif response.status_code == 200:
+                # Server ignored the range (or the file changed), start over
+                self._discard_partial(part_path, etag_path)
+                offset = 0
+                total_size = int(response.headers.get('Content-Length', 0)) or None
+                mode = 'wb'
+                if self._is_encoded(response):
+                    # Compressed despite the request: Content-Length counts the
+                    # encoded bytes and a range of them cannot be resumed, so
+                    # the body is saved decoded, without an ETag to resume from
+                    total_size = None
+                    decode = True
+                elif self._supports_segments(response, total_size):
+                    # The segments use connections of their own
+                    response.close()
+                    item.etag = response.headers.get('ETag')
+                    return self._download_segmented(item, total_size, item.etag)
+            else:
+                tqdm.write(f"Failed to download {item.file_name}: HTTP {response.status_code}")
                 return False
-                
-            total_size = int(response.headers.get('Content-Length', 0))
             
-            with open(item.file_name, 'wb') as file:
+            etag = response.headers.get('ETag')
+            if etag and not etag.startswith('W/') and not decode:
+                with open(etag_path, 'w') as file:
+                    file.write(etag)
+                item.etag = etag
+            
+            with open(part_path, mode) as file:
                 with tqdm(
                     total=total_size,
+                    initial=offset,
                     unit='B',
                     unit_scale=True,
                     desc=item.file_name,
-                    ascii=True
+                    ascii=True,
+                    leave=False
                 ) as progress_bar:
-                    for chunk in response.iter_content(chunk_size=1024):
-                        if chunk:
-                            file.write(chunk)
-                            progress_bar.update(len(chunk))
-                            
-            print(f"Completed downloading {item.file_name}.")
+                    self._copy_stream(response, file, progress_bar, total_size,
+                                      decode=decode)
+        
+        received = os.path.getsize(part_path)
+        if total_size is not None and received != total_size:
+            raise IncompleteDownloadError(f"received {received} of {total_size} bytes")
+        
+        self._finalize(part_path, etag_path, item.file_name)
+        tqdm.write(f"Completed downloading {item.file_name}.")
+        return True
+    
+    def _matches_remote_size(self, item: DownloadItem) -> bool:
+        """
+        Check whether the file at the target has the size the server reports.
+        
+        Parameters
+        ----------
+        item : DownloadItem
+            The item whose target file exists
+        
+        Returns
+        -------
+        bool
+            True if a ``HEAD`` request succeeded with a ``Content-Length``
+            equal to the size of the file
+        
+        Raises
+        ------
+        requests.RequestException
+            If the connection fails
+        """
+        with self.retry_policy.request(self.session, item.file_url, method="HEAD",
+                                       headers=self.REQUEST_HEADERS,
+                                       allow_redirects=True) as response:
+            if response.status_code != 200 or self._is_encoded(response):
+                return False
+            remote_size = response.headers.get('Content-Length')
+            if not remote_size or int(remote_size) != os.path.getsize(item.file_name):
+                return False
+            etag = response.headers.get('ETag')
+            if etag and not etag.startswith('W/'):
+                item.etag = etag
             return True
+    
+    def _buffer_size(self, total_size: Optional[int]) -> int:
+        """
+        Pick the read buffer size for a download.
+        
+        Parameters
+        ----------
+        total_size : Optional[int]
+            Expected number of bytes, None if unknown
+        
+        Returns
+        -------
+        int
+            The configured chunk size, or one sixteenth of the file
+            clamped to the configured minimum and maximum
+        """
+        if self.chunk_size:
+            return self.chunk_size
+        if not total_size:
+            return MIN_DOWNLOAD_CHUNK_SIZE
+        return max(MIN_DOWNLOAD_CHUNK_SIZE, min(total_size // 16, MAX_DOWNLOAD_CHUNK_SIZE))
+    
+    def _copy_stream(self, response: requests.Response, file: Any, progress_bar: 'tqdm',
+                     total_size: Optional[int], lock: Optional[threading.Lock] = None,
+                     decode: bool = False) -> int:
+        """
+        Copy a streamed response body into an open file.
+        
+        The body is read into one reusable buffer and progress is reported
+        at most every PROGRESS_UPDATE_INTERVAL seconds. Unless `decode` is
+        set, bytes are written as received, without undoing any
+        ``Content-Encoding``, so the count matches ``Content-Length`` and
+        ``Content-Range``.
+        
+        Parameters
+        ----------
+        response : requests.Response
+            Streamed response to read from
+        file : Any
+            Binary file object positioned where the data should go
+        progress_bar : tqdm
+            Progress bar to update
+        total_size : Optional[int]
+            Expected number of bytes, used to size the buffer
+        lock : Optional[threading.Lock], optional
+            Lock guarding a progress bar shared between threads, by default None
+        decode : bool, optional
+            Undo the ``Content-Encoding`` of the body, by default False
+        
+        Returns
+        -------
+        int
+            Number of bytes written
+        
+        Raises
+        ------
+        IncompleteDownloadError
+            If the connection broke while reading, so the caller can resume
+        """
+        buffer_size = self._buffer_size(total_size)
+        if decode:
+            # A decoded read can return more than it was asked for, so
+            # the chunks are not read into the buffer
+            chunks = response.iter_content(chunk_size=buffer_size)
+        else:
+            chunks = self._read_raw(response, buffer_size)
+        
+        written = 0
+        pending = 0
+        last_update = time.monotonic()
+        
+        for chunk in chunks:
+            file.write(chunk)
+            written += len(chunk)
+            pending += len(chunk)
             
-        except Exception as e:
-            print(f"Error downloading {item.file_name}: {str(e)}")
-            return False
\ No newline at end of file
+            now = time.monotonic()
+            if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                self._update_progress(progress_bar, pending, lock)
+                pending = 0
+                last_update = now
+        
+        if pending:
+            self._update_progress(progress_bar, pending, lock)
+        return written
+    
+    @staticmethod
+    def _read_raw(response: requests.Response, buffer_size: int) -> Iterator[memoryview]:
+        """
+        Read a response body as received, reusing one buffer.
+        
+        Parameters
+        ----------
+        response : requests.Response
+            Streamed response to read from
+        buffer_size : int
+            Size of the buffer in bytes
+        
+        Yields
+        ------
+        memoryview
+            View of the bytes read, valid until the next one is requested
+        
+        Raises
+        ------
+        IncompleteDownloadError
+            If the connection broke while reading
+        """
+        raw = response.raw
+        raw.decode_content = False
+        buffer = bytearray(buffer_size)
+        view = memoryview(buffer)
+        
+        while True:
+            try:
+                size = raw.readinto(buffer)
+            except Urllib3Error as e:
+                # iter_content used to turn these into requests exceptions
+                raise IncompleteDownloadError(f"connection broken: {str(e)}") from e
+            if not size:
+                break
+            yield view[:size]
+    
+    @staticmethod
+    def _is_encoded(response: requests.Response) -> bool:
+        """Check whether a response body carries a ``Content-Encoding``."""
+        encoding = response.headers.get('Content-Encoding', '').strip().lower()
+        return encoding not in ('', 'identity')
+    
+    @staticmethod
+    def _update_progress(progress_bar: 'tqdm', size: int,
+                         lock: Optional[threading.Lock] = None) -> None:
+        """Advance a progress bar, holding `lock` if one is given."""
+        if lock is None:
+            progress_bar.update(size)
+            return
+        with lock:
+            progress_bar.update(size)
+    
+    def _supports_segments(self, response: requests.Response,
+                           total_size: Optional[int]) -> bool:
+        """
+        Check whether a file should be fetched with a segmented download.
+        
+        Parameters
+        ----------
+        response : requests.Response
+            Response to the initial full-file request
+        total_size : Optional[int]
+            File size from ``Content-Length``
+        
+        Returns
+        -------
+        bool
+            True if the file is large enough and the server accepts byte ranges
+        """
+        return (self.segments > 1 and
+                total_size is not None and
+                total_size >= self.segment_threshold and
+                response.headers.get('Accept-Ranges', '').lower() == 'bytes')
+    
+    def _download_segmented(self, item: DownloadItem, total_size: int,
+                            etag: Optional[str] = None) -> bool:
+        """
+        Download a file as concurrent byte ranges into a preallocated file.
+        
+        The bytes received for every range are saved to the segment state
+        file whenever a range finishes or fails, and a later call for the
+        same file version only requests what is still missing.
+        
+        Parameters
+        ----------
+        item : DownloadItem
+            The file to download
+        total_size : int
+            Size of the file in bytes
+        etag : Optional[str], optional
+            ETag of the file, sent as ``If-Range`` so every segment
+            comes from the same version, by default None
+        
+        Returns
+        -------
+        bool
+            True if the file was completed
+        
+        Raises
+        ------
+        requests.RequestException
+            If a segment connection fails
+        IncompleteDownloadError
+            If a segment is short or the server did not honour its range
+        """
+        from tqdm import tqdm
+        
+        seg_path = item.file_name + self.SEGMENT_SUFFIX
+        state_path = seg_path + self.SEGMENT_STATE_SUFFIX
+        if etag and etag.startswith('W/'):
+            etag = None
+        
+        state = self._read_segment_state(item.file_name)
+        if (state is None or state['size'] != total_size or state.get('etag') != etag
+                or not os.path.exists(seg_path)):
+            segment_size = -(-total_size // self.segments)
+            state = {
+                'size': total_size,
+                'etag': etag,
+                # [first byte, last byte, bytes received] of every range
+                'segments': [
+                    [start, min(start + segment_size, total_size) - 1, 0]
+                    for start in range(0, total_size, segment_size)
+                ]
+            }
+            with open(seg_path, 'wb') as file:
+                file.truncate(total_size)
+            self._write_segment_state(state_path, state)
+        
+        segments = state['segments']
+        pending = [segment for segment in segments if segment[2] < segment[1] - segment[0] + 1]
+        lock = threading.Lock()
+        changed = threading.Event()
+        
+        with tqdm(
+            total=total_size,
+            initial=sum(segment[2] for segment in segments),
+            unit='B',
+            unit_scale=True,
+            desc=item.file_name,
+            ascii=True,
+            leave=False
+        ) as progress_bar:
+            def fetch_range(segment: List[int]) -> None:
+                start, end, done = segment
+                first = start + done
+                headers = {**self.REQUEST_HEADERS, 'Range': f"bytes={first}-{end}"}
+                if etag:
+                    headers['If-Range'] = etag
+                
+                with self.retry_policy.request(self.session, item.file_url, stream=True,
+                                               headers=headers) as response:
+                    range_start, range_total = self._parse_content_range(
+                        response.headers.get('Content-Range'))
+                    if response.status_code == 200 or (range_total is not None and
+                                                       range_total != total_size):
+                        # The file changed since the segments were planned
+                        changed.set()
+                    if self._is_encoded(response):
+                        # Encoded ranges do not fit the planned offsets, and
+                        # the next attempt downloads the file decoded
+                        changed.set()
+                        raise IncompleteDownloadError(
+                            f"server compressed range {first}-{end}")
+                    if (response.status_code != 206 or range_start != first or
+                            range_total != total_size):
+                        raise IncompleteDownloadError(
+                            f"server did not honour range {first}-{end} (HTTP {response.status_code})")
+                    
+                    with open(seg_path, 'r+b') as segment_file:
+                        segment_file.seek(first)
+                        try:
+                            self._copy_stream(response, segment_file, progress_bar,
+                                              end - first + 1, lock)
+                        finally:
+                            segment_file.flush()
+                            received = min(segment_file.tell(), end + 1) - start
+                            with lock:
+                                segment[2] = received
+                                self._write_segment_state(state_path, state)
+                
+                if segment[2] != end - start + 1:
+                    raise IncompleteDownloadError(
+                        f"segment {start}-{end} received {segment[2]} of {end - start + 1} bytes")
+            
+            try:
+                with ThreadPoolExecutor(max_workers=max(1, len(pending))) as executor:
+                    for future in [executor.submit(fetch_range, segment) for segment in pending]:
+                        future.result()
+            except IncompleteDownloadError:
+                if changed.is_set():
+                    self._discard_partial(seg_path, state_path)
+                raise
+        
+        received = sum(segment[2] for segment in segments)
+        if received != total_size:
+            raise IncompleteDownloadError(f"segments received {received} of {total_size} bytes")
+        
+        os.replace(seg_path, item.file_name)
+        os.remove(state_path)
+        tqdm.write(f"Completed downloading {item.file_name} ({len(segments)} segments).")
+        return True
+    
+    def _read_segment_state(self, file_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the saved progress of a segmented download, if any.
+        
+        Parameters
+        ----------
+        file_name : str
+            Target file of the download
+        
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The file size, ETag and per-range progress, None if there is no
+            usable state or no segment file to go with it
+        """
+        seg_path = file_name + self.SEGMENT_SUFFIX
+        state_path = seg_path + self.SEGMENT_STATE_SUFFIX
+        if not (os.path.exists(state_path) and os.path.exists(seg_path)):
+            return None
+        try:
+            with open(state_path) as file:
+                state = json.load(file)
+            if os.path.getsize(seg_path) != state['size'] or not state['segments']:
+                return None
+            return state
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    @staticmethod
+    def _write_segment_state(state_path: str, state: Dict[str, Any]) -> None:
+        """Atomically save the progress of a segmented download."""
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(state, file)
+        os.replace(tmp_path, state_path)
+    
+    @staticmethod
+    def _parse_content_range(content_range: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Parse a ``Content-Range`` header.
+        
+        Parameters
+        ----------
+        content_range : Optional[str]
+            Header value such as ``bytes 100-199/1000`` or ``bytes */1000``
+        
+        Returns
+        -------
+        Tuple[Optional[int], Optional[int]]
+            Start offset and total size, None where not present
+        """
+        if not content_range:
+            return None, None
+        match = re.match(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)', content_range.strip())
+        if not match:
+            return None, None
+        start = int(match.group(1)) if match.group(1) is not None else None
+        total = int(match.group(2)) if match.group(2) != '*' else None
+        return start, total
+    
+    @staticmethod
+    def _read_etag(etag_path: str) -> Optional[str]:
+        """Read the ETag saved alongside a partial file, if any."""
+        if not os.path.exists(etag_path):
+            return None
+        with open(etag_path) as file:
+            return file.read().strip() or None
+    
+    @staticmethod
+    def _discard_partial(part_path: str, etag_path: str) -> None:
+        """Remove a partial file and its saved ETag."""
+        for path in (part_path, etag_path):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    @staticmethod
+    def _finalize(part_path: str, etag_path: str, file_name: str) -> None:
+        """Move a completed partial file to its final name."""
+        os.replace(part_path, file_name)
+        if os.path.exists(etag_path):
+            os.remove(etag_path)
@@ -1,11 +1,18 @@
 """
 Download manager for coordinating multiple downloaders.
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
+import requests
 
 from src.downloaders.base import Downloader, DownloadItem
 from src.downloaders.youtube import YouTubeDownloader
 from src.downloaders.base import HttpDownloader
+from src.downloaders.manifest import DownloadManifest
+from src.utils.config import DEFAULT_DOWNLOAD_SEGMENTS
+from src.utils.http import build_session
+from src.utils.retry import RetryPolicy
 
 
 class DownloadManager:
@@ -16,11 +23,33 @@ class DownloadManager:
     and keeps track of download progress.
     """
     
-    def __init__(self):
-        """Initialize with default downloaders."""
+    def __init__(self, max_workers: int = 1,
+                 session: Optional[requests.Session] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Initialize with default downloaders.
+        
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of items to download in parallel, and of YouTube worker
+            processes, by default 1 (sequential)
+        session : Optional[requests.Session], optional
+            Session shared by HTTP downloads, e.g. the authenticated session,
+            by default None (a new session is created). Its connection pool
+            is sized for `max_workers` segmented downloads.
+        retry_policy : Optional[RetryPolicy], optional
+            Policy HTTP downloads are sent through, e.g. the authenticator's,
+            by default None (a new policy is created)
+        """
+        self.max_workers = max(1, max_workers)
+        self.session = build_session(
+            pool_size=self.max_workers * DEFAULT_DOWNLOAD_SEGMENTS,
+            session=session
+        )
         self.downloaders: List[Downloader] = [
-            YouTubeDownloader(),
-            HttpDownloader()
+            YouTubeDownloader(workers=self.max_workers),
+            HttpDownloader(session=self.session, retry_policy=retry_policy)
         ]
         
     def add_downloader(self, downloader: Downloader) -> None:
@@ -34,6 +63,16 @@ class DownloadManager:
         """
         self.downloaders.append(downloader)
         
+    def close(self) -> None:
+        """
+        Close every downloader, stopping worker processes.
+        
+        The manager can still be used afterwards; downloaders start their
+        workers again when needed.
+        """
+        for downloader in self.downloaders:
+            downloader.close()
+        
     def download_item(self, item: DownloadItem) -> bool:
         """
         Download a single item using an appropriate downloader.
@@ -56,16 +95,28 @@ class DownloadManager:
         return False
         
     def download_items(self, items: List[DownloadItem],
-                      existing_files: Optional[List[str]] = None) -> Dict[str, bool]:
+                      existing_files: Optional[List[str]] = None,
+                      manifest: Optional[DownloadManifest] = None) -> Dict[str, bool]:
         """
         Download multiple items, skipping existing files.
         
+        Items are downloaded in parallel when the manager was created
+        with more than one worker. Before that, every downloader's
+        `preflight` drops items that cannot be downloaded and fills in
+        sizes, and items of known size are started largest first.
+        Items with the same target path are downloaded one at a time.
+        Results keep the order of `items`.
+        
         Parameters
         ----------
         items : List[DownloadItem]
             List of items to download
         existing_files : List[str], optional
-            List of existing file names to skip, by default None
+            List of existing file names to skip, by default None.
+            Ignored when a manifest is given.
+        manifest : Optional[DownloadManifest], optional
+            Manifest used to skip completed files and record new ones,
+            by default None
             
         Returns
         -------
@@ -73,14 +124,127 @@ class DownloadManager:
             Dictionary of file names and whether they were successfully downloaded
         """
         existing = set(existing_files or [])
+        wanted = {item.file_name for item in items}
         results: Dict[str, bool] = {}
+        pending: List[DownloadItem] = []
         
         for item in items:
-            if item.file_name in existing:
+            if manifest is not None:
+                already_downloaded = manifest.is_complete(item, wanted)
+            else:
+                already_downloaded = item.file_name in existing
+                
+            if already_downloaded:
                 print(f"Already downloaded... {item.file_name}")
                 results[item.file_name] = True
                 continue
                 
-            results[item.file_name] = self.download_item(item)
+            results[item.file_name] = False
+            pending.append(item)
+            
+        pending = self._schedule(pending)
+        
+        # Items that write the same file are downloaded one after another by
+        # the same task, so they never share a .part file at the same time
+        groups: Dict[str, List[DownloadItem]] = {}
+        for item in pending:
+            groups.setdefault(os.path.abspath(item.file_name), []).append(item)
+            
+        if self.max_workers == 1 or len(groups) <= 1:
+            for group in groups.values():
+                success = self._download_group(group, manifest)
+                for item in group:
+                    results[item.file_name] = success
+            return results
+            
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (group, executor.submit(self._download_group, group, manifest))
+                for group in groups.values()
+            ]
+            for group, future in futures:
+                success = future.result()
+                for item in group:
+                    results[item.file_name] = success
+                    
+        return results
+    
+    def _schedule(self, items: List[DownloadItem]) -> List[DownloadItem]:
+        """
+        Run the pre-flight checks and order items largest first.
+        
+        Parameters
+        ----------
+        items : List[DownloadItem]
+            Items to download
+            
+        Returns
+        -------
+        List[DownloadItem]
+            Downloadable items, those of known size first, largest first
+        """
+        by_downloader: Dict[int, List[DownloadItem]] = {}
+        for item in items:
+            for index, downloader in enumerate(self.downloaders):
+                if downloader.can_handle(item):
+                    by_downloader.setdefault(index, []).append(item)
+                    break
+                    
+        kept = set()
+        for index, group in by_downloader.items():
+            kept.update(id(item) for item in self.downloaders[index].preflight(group))
             
-        return results
\ No newline at end of file
+        # Items no downloader handles stay, and are reported when downloaded
+        handled = {id(item) for group in by_downloader.values() for item in group}
+        scheduled = [item for item in items if id(item) in kept or id(item) not in handled]
+        
+        # Stable sort: items of unknown size keep their order, after the others
+        scheduled.sort(key=lambda item: item.size or 0, reverse=True)
+        
+        known = [item.size for item in scheduled if item.size]
+        if known:
+            print(f"{len(scheduled)} files to download, "
+                  f"{sum(known) / (1024 * 1024):.1f} MiB known for {len(known)} of them.")
+        return scheduled
+    
+    def _download_group(self, items: List[DownloadItem],
+                        manifest: Optional[DownloadManifest] = None) -> bool:
+        """
+        Download items that share a target path, one after another.
+        
+        Parameters
+        ----------
+        items : List[DownloadItem]
+            Items writing the same file
+        manifest : Optional[DownloadManifest], optional
+            Manifest to update, by default None
+            
+        Returns
+        -------
+        bool
+            True if every item was downloaded, False otherwise
+        """
+        results = [self._download_and_record(item, manifest) for item in items]
+        return all(results)
+    
+    def _download_and_record(self, item: DownloadItem,
+                             manifest: Optional[DownloadManifest] = None) -> bool:
+        """
+        Download an item and record the outcome in the manifest, if any.
+        
+        Parameters
+        ----------
+        item : DownloadItem
+            The item to download
+        manifest : Optional[DownloadManifest], optional
+            Manifest to update, by default None
+            
+        Returns
+        -------
+        bool
+            True if download was successful, False otherwise
+        """
+        success = self.download_item(item)
+        if manifest is not None:
+            manifest.record(item, completed=success)
+        return success
@@ -0,0 +1,176 @@
+"""
+Persistent record of downloaded files for a course.
+"""
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+
+from src.downloaders.base import DownloadItem
+
+
+class DownloadManifest:
+    """
+    SQLite-backed manifest of the files downloaded for a course.
+    
+    Each row records the URL, file name, size, ETag, SHA-256 checksum and
+    completion state of a file. Paths are stored relative to the directory
+    holding the manifest, so one manifest covers every resource folder of
+    a course. Deciding whether an item still needs downloading is an
+    indexed lookup plus one ``stat`` of the file.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS downloads (
+            file_name TEXT PRIMARY KEY,
+            file_url TEXT NOT NULL,
+            size INTEGER,
+            etag TEXT,
+            sha256 TEXT,
+            completed INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS downloads_by_url ON downloads (file_url);
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) a manifest database.
+        
+        Parameters
+        ----------
+        path : str
+            Path to the SQLite file; its directory is the base for stored paths
+        """
+        self.path = os.path.abspath(path)
+        self.base_dir = os.path.dirname(self.path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(self.SCHEMA)
+    
+    def is_complete(self, item: DownloadItem, wanted: Iterable[str] = ()) -> bool:
+        """
+        Check whether an item has already been fully downloaded.
+        
+        A file counts as done only if the manifest marks it complete and
+        the file on disk still has the recorded size. If the same URL was
+        completed under another name, that file is reused instead of being
+        downloaded again: a renamed lecture is moved to its new name when
+        the old name is in the same folder and no item of the current batch
+        wants it, and otherwise the file is copied.
+        
+        Parameters
+        ----------
+        item : DownloadItem
+            The item to check
+        wanted : Iterable[str], optional
+            File names of every item in the current batch, by default ()
+        
+        Returns
+        -------
+        bool
+            True if the item does not need to be downloaded
+        """
+        key = self._key(item.file_name)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size FROM downloads WHERE file_name = ? AND file_url = ? AND completed = 1",
+                (key, item.file_url)
+            ).fetchone()
+            if row is not None:
+                return self._has_size(key, row[0])
+            
+            rows = self._connection.execute(
+                "SELECT file_name, size, etag, sha256 FROM downloads "
+                "WHERE file_url = ? AND completed = 1",
+                (item.file_url,)
+            ).fetchall()
+            sources = [row for row in rows if self._has_size(row[0], row[1])]
+            if not sources:
+                return False
+            
+            # A file another item of this batch still owns, e.g. the same
+            # PDF attached to two lectures, must stay where it is
+            wanted_keys = {self._key(file_name) for file_name in wanted}
+            movable = [row for row in sources
+                       if row[0] not in wanted_keys and
+                       os.path.dirname(row[0]) == os.path.dirname(key)]
+            
+            if movable:
+                old_key = movable[0][0]
+                os.replace(self._abs_path(old_key), self._abs_path(key))
+                self._connection.execute("DELETE FROM downloads WHERE file_name = ?", (key,))
+                self._connection.execute(
+                    "UPDATE downloads SET file_name = ?, updated_at = ? WHERE file_name = ?",
+                    (key, time.time(), old_key)
+                )
+                self._connection.commit()
+                print(f"Renamed {old_key} to {key}")
+                return True
+            
+            old_key, size, etag, checksum = sources[0]
+            shutil.copyfile(self._abs_path(old_key), self._abs_path(key))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO downloads "
+                "(file_name, file_url, size, etag, sha256, completed, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 1, ?)",
+                (key, item.file_url, size, etag, checksum, time.time())
+            )
+            self._connection.commit()
+            print(f"Copied {old_key} to {key}")
+            return True
+    
+    def record(self, item: DownloadItem, completed: bool = True) -> None:
+        """
+        Record the state of a downloaded item.
+        
+        Parameters
+        ----------
+        item : DownloadItem
+            The downloaded item
+        completed : bool, optional
+            Whether the download finished, by default True
+        """
+        key = self._key(item.file_name)
+        path = self._abs_path(key)
+        size = os.path.getsize(path) if os.path.exists(path) else None
+        checksum = self._sha256(path) if completed and size is not None else None
+        
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO downloads "
+                "(file_name, file_url, size, etag, sha256, completed, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, item.file_url, size, item.etag, checksum, int(completed), time.time())
+            )
+            self._connection.commit()
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+    
+    def _key(self, file_name: str) -> str:
+        """Get the manifest key (path relative to the manifest) of a file."""
+        return os.path.relpath(os.path.abspath(file_name), self.base_dir)
+    
+    def _abs_path(self, key: str) -> str:
+        """Get the absolute path of a manifest key."""
+        return os.path.join(self.base_dir, key)
+    
+    def _has_size(self, key: str, size: Optional[int]) -> bool:
+        """Check that a recorded file exists on disk with the expected size."""
+        path = self._abs_path(key)
+        return os.path.isfile(path) and os.path.getsize(path) == size
+    
+    @staticmethod
+    def _sha256(path: str) -> str:
+        """Compute the SHA-256 checksum of a file."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
@@ -1,19 +1,142 @@
 """
 YouTube video downloader implementation.
 """
-import youtube_dl
-from typing import Dict, Any, Optional
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional, Tuple
 
 from src.downloaders.base import Downloader, DownloadItem
-from src.utils.config import DEFAULT_YOUTUBE_OPTIONS
+from src.utils.config import (
+    DEFAULT_YOUTUBE_OPTIONS,
+    DEFAULT_YOUTUBE_WORKERS,
+    YOUTUBE_INFO_CACHE_FILE,
+    YOUTUBE_INFO_TTL
+)
+
+
+# YoutubeDL instances of the current worker process or thread, by options,
+# reused for every video so extractors are only initialised once
+_worker_state = threading.local()
+
+
+def _get_youtube_dl(options: Dict[str, Any]) -> Any:
+    """
+    Get the YoutubeDL instance of the current process or thread.
+    
+    Parameters
+    ----------
+    options : Dict[str, Any]
+        youtube-dl options of the instance
+    
+    Returns
+    -------
+    youtube_dl.YoutubeDL
+        The reusable YoutubeDL instance
+    """
+    instances = getattr(_worker_state, 'instances', None)
+    if instances is None:
+        instances = _worker_state.instances = {}
+    
+    key = json.dumps(options, sort_keys=True, default=str)
+    if key not in instances:
+        import youtube_dl
+        
+        instances[key] = youtube_dl.YoutubeDL(dict(options))
+    return instances[key]
+
+
+def _extract_video_info(options: Dict[str, Any], url: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Look up a video without downloading it.
+    
+    Runs in a worker process, so errors are returned rather than raised.
+    
+    Parameters
+    ----------
+    options : Dict[str, Any]
+        youtube-dl options, whose 'format' picks the formats
+    url : str
+        Video URL
+    
+    Returns
+    -------
+    Tuple[Optional[Dict[str, Any]], str]
+        The chosen 'format_id', the total 'filesize' (None if unknown) and
+        the 'title', or None and the error message if the video is unavailable
+    """
+    try:
+        ydl = _get_youtube_dl(options)
+        ydl.params['format'] = options.get('format')
+        info = ydl.extract_info(url, download=False)
+        
+        formats = info.get('requested_formats') or [info]
+        sizes = [f.get('filesize') or f.get('filesize_approx') for f in formats]
+        return {
+            'format_id': info.get('format_id'),
+            'filesize': int(sum(sizes)) if all(sizes) else None,
+            'title': info.get('title')
+        }, ""
+    except BaseException as e:
+        return None, str(e)
+
+
+def _download_video(options: Dict[str, Any], file_name: str, url: str,
+                    format_id: Optional[str] = None) -> Tuple[bool, str]:
+    """
+    Download one video with the reusable YoutubeDL instance.
+    
+    Runs in a worker process, so errors are returned rather than raised.
+    
+    Parameters
+    ----------
+    options : Dict[str, Any]
+        youtube-dl options
+    file_name : str
+        Absolute output path; a worker keeps the working directory it was
+        started in, which need not be the caller's current one
+    url : str
+        Video URL
+    format_id : Optional[str], optional
+        Format picked by the pre-flight, by default None (select with the
+        'format' option)
+    
+    Returns
+    -------
+    Tuple[bool, str]
+        Whether the download succeeded, and the error message if not
+    """
+    try:
+        ydl = _get_youtube_dl(options)
+        ydl.params['outtmpl'] = file_name
+        ydl.params['format'] = format_id or options.get('format')
+        ydl.download([url])
+        return True, ""
+    except BaseException as e:
+        return False, str(e)
 
 
 class YouTubeDownloader(Downloader):
     """
     Downloader implementation for YouTube videos using youtube-dl.
+    
+    Videos are downloaded by a pool of `workers` processes, each keeping one
+    YoutubeDL instance for all its videos. Separate processes let several
+    videos download (and merge) in parallel without sharing the GIL.
+    
+    `preflight` looks up all videos of a batch at once, so formats are chosen
+    once, sizes are known before downloading and unavailable videos never
+    take a worker. The results are cached in `info_cache_file`.
     """
     
-    def __init__(self, options: Optional[Dict[str, Any]] = None):
+    def __init__(self, options: Optional[Dict[str, Any]] = None,
+                 workers: int = DEFAULT_YOUTUBE_WORKERS,
+                 info_cache_file: Optional[str] = YOUTUBE_INFO_CACHE_FILE,
+                 info_ttl: float = YOUTUBE_INFO_TTL):
         """
         Initialize with optional custom youtube-dl options.
         
@@ -21,8 +144,22 @@ class YouTubeDownloader(Downloader):
         ----------
         options : Dict[str, Any], optional
             Custom options for youtube-dl, by default None
+        workers : int, optional
+            Number of worker processes, by default DEFAULT_YOUTUBE_WORKERS.
+            With 0, videos are downloaded in the calling thread.
+        info_cache_file : Optional[str], optional
+            File caching pre-flight results, by default YOUTUBE_INFO_CACHE_FILE.
+            None disables the cache.
+        info_ttl : float, optional
+            Seconds a cached result is used, by default YOUTUBE_INFO_TTL
         """
         self.options = options or DEFAULT_YOUTUBE_OPTIONS
+        self.workers = max(0, workers)
+        self.info_cache_file = info_cache_file
+        self.info_ttl = info_ttl
+        self._infos: Dict[str, Dict[str, Any]] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
     
     def can_handle(self, item: DownloadItem) -> bool:
         """
@@ -32,7 +169,7 @@ class YouTubeDownloader(Downloader):
         ----------
         item : DownloadItem
             The item to check
-            
+        
         Returns
         -------
         bool
@@ -49,25 +186,198 @@ class YouTubeDownloader(Downloader):
         ----------
         item : DownloadItem
             The video details to download
-            
+        
         Returns
         -------
         bool
             True if download was successful, False otherwise
         """
-        try:
-            print(f"Downloading YouTube video... {item.file_name}")
-            
-            # Create a copy of options and set the output template
-            ydl_opts = dict(self.options)
-            ydl_opts['outtmpl'] = item.file_name
-            
-            with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([item.file_url])
-                
+        print(f"Downloading YouTube video... {item.file_name}")
+        format_id = self._infos.get(item.file_url, {}).get('format_id')
+        
+        success, error = self._run_download(item, format_id)
+        if not success and format_id:
+            # The format picked by a cached pre-flight may no longer be offered
+            success, error = self._run_download(item)
+        
+        if success:
             print(f"Completed downloading {item.file_name}.")
-            return True
-            
-        except Exception as e:
-            print(f"Error downloading YouTube video {item.file_name}: {str(e)}")
-            return False
\ No newline at end of file
+        else:
+            print(f"Error downloading YouTube video {item.file_name}: {error}")
+        return success
+    
+    def _run_download(self, item: DownloadItem, format_id: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        Download a video in the worker pool, or in this thread without workers.
+        
+        Parameters
+        ----------
+        item : DownloadItem
+            The video to download
+        format_id : Optional[str], optional
+            Format to download, by default None (select with the 'format' option)
+        
+        Returns
+        -------
+        Tuple[bool, str]
+            Whether the download succeeded, and the error message if not
+        """
+        file_path = os.path.abspath(item.file_name)
+        if not self.workers:
+            return _download_video(self.options, file_path, item.file_url, format_id)
+        
+        try:
+            future = self._get_pool().submit(
+                _download_video, self.options, file_path, item.file_url, format_id)
+            return future.result()
+        except BrokenProcessPool as e:
+            # A crashed worker breaks the whole pool: start a new one next time
+            with self._pool_lock:
+                self._pool = None
+            return False, str(e) or "worker process died"
+    
+    def preflight(self, items: List[DownloadItem]) -> List[DownloadItem]:
+        """
+        Look up every video before downloading.
+        
+        Videos missing from the info cache are extracted concurrently by the
+        worker pool without downloading. The chosen format is used for the
+        download and the size is stored in `DownloadItem.size`.
+        
+        Parameters
+        ----------
+        items : List[DownloadItem]
+            YouTube videos to download
+        
+        Returns
+        -------
+        List[DownloadItem]
+            The videos that are available
+        """
+        cache = self._load_info_cache()
+        now = time.time()
+        
+        lookups: List[str] = []
+        for item in items:
+            cached = cache.get(self._info_key(item.file_url))
+            if cached is not None and now - cached['extracted_at'] < self.info_ttl:
+                self._infos[item.file_url] = cached
+            elif item.file_url not in lookups:
+                lookups.append(item.file_url)
+        
+        unavailable: Dict[str, str] = {}
+        if lookups:
+            print(f"Looking up {len(lookups)} YouTube videos...")
+            for url, (info, error) in self._extract_infos(lookups).items():
+                if info is None:
+                    unavailable[url] = error
+                    continue
+                info['extracted_at'] = now
+                self._infos[url] = cache[self._info_key(url)] = info
+            self._save_info_cache(cache)
+        
+        available = []
+        for item in items:
+            if item.file_url in unavailable:
+                print(f"Skipping unavailable YouTube video {item.file_name}: {unavailable[item.file_url]}")
+                continue
+            item.size = self._infos[item.file_url].get('filesize')
+            available.append(item)
+        return available
+    
+    def close(self) -> None:
+        """Stop the worker processes, if any."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+    
+    def _extract_infos(self, urls: List[str]) -> Dict[str, Tuple[Optional[Dict[str, Any]], str]]:
+        """
+        Extract the info of several videos, concurrently in the worker pool.
+        
+        Parameters
+        ----------
+        urls : List[str]
+            Video URLs
+        
+        Returns
+        -------
+        Dict[str, Tuple[Optional[Dict[str, Any]], str]]
+            Result of `_extract_video_info` for every URL
+        """
+        if not self.workers:
+            return {url: _extract_video_info(self.options, url) for url in urls}
+        
+        pool = self._get_pool()
+        futures = {url: pool.submit(_extract_video_info, self.options, url) for url in urls}
+        results = {}
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except BrokenProcessPool as e:
+                with self._pool_lock:
+                    self._pool = None
+                results[url] = (None, str(e) or "worker process died")
+        return results
+    
+    def _info_key(self, url: str) -> str:
+        """Get the info cache key of a video: the format selection and the URL."""
+        return f"{self.options.get('format')}\n{url}"
+    
+    def _load_info_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the cached pre-flight results.
+        
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Results by cache key, empty if there is no usable cache
+        """
+        if not self.info_cache_file:
+            return {}
+        try:
+            with open(self.info_cache_file, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_info_cache(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Save pre-flight results, dropping expired ones.
+        
+        Parameters
+        ----------
+        cache : Dict[str, Dict[str, Any]]
+            Results by cache key
+        """
+        if not self.info_cache_file:
+            return
+        now = time.time()
+        fresh = {key: info for key, info in cache.items() if now - info['extracted_at'] < self.info_ttl}
+        try:
+            os.makedirs(os.path.dirname(self.info_cache_file), mode=0o700, exist_ok=True)
+            tmp_path = f"{self.info_cache_file}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as file:
+                json.dump(fresh, file)
+            os.replace(tmp_path, self.info_cache_file)
+        except OSError as e:
+            print(f"Could not save the YouTube info cache: {str(e)}")
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the worker pool, starting it on first use.
+        
+        Returns
+        -------
+        ProcessPoolExecutor
+            The pool of worker processes
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                # Forking a process that runs download threads is unsafe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._pool
@@ -1,7 +1,14 @@
 """
 Scrapers package for fetching data from Hello IITK.
 """
-from src.scrapers.base import BaseScraper
-from src.scrapers.lectures import LecturesScraper
-from src.scrapers.forums import ForumsScraper
-from src.scrapers.quiz_assignment import QuizAssignmentScraper
\ No newline at end of file
+from src.utils.lazy import lazy_getattr
+
+_EXPORTS = {
+    'BaseScraper': 'src.scrapers.base',
+    'LecturesScraper': 'src.scrapers.lectures',
+    'ForumsScraper': 'src.scrapers.forums',
+    'QuizAssignmentScraper': 'src.scrapers.quiz_assignment',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
@@ -3,10 +3,13 @@ Base scraper classes and interfaces.
 """
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
+import asyncio
 import json
 
 from src.core.auth import Authenticator
 from src.core.course import Course
+from src.utils.cache import ResponseCache
+from src.utils.config import DEFAULT_API_CONCURRENCY
 
 
 class BaseScraper(ABC):
@@ -17,7 +20,8 @@ class BaseScraper(ABC):
     and defines the interface they must implement.
     """
     
-    def __init__(self, auth: Authenticator, course: Course):
+    def __init__(self, auth: Authenticator, course: Course,
+                 cache: Optional[ResponseCache] = None):
         """
         Initialize with authenticator and course information.
         
@@ -27,9 +31,12 @@ class BaseScraper(ABC):
             Authenticated authenticator instance
         course : Course
             Course information
+        cache : Optional[ResponseCache], optional
+            Cache for API responses, by default None (the default on-disk cache)
         """
         self.auth = auth
         self.course = course
+        self.cache = cache if cache is not None else ResponseCache()
         
     @property
     def api_base(self) -> str:
@@ -69,12 +76,67 @@ class BaseScraper(ABC):
             raise ValueError("Authentication required for API requests")
         
         url = f"{self.api_base}/{endpoint}"
-        response = self.auth.session.get(url, headers=self.auth.headers)
+        status_code, body = self.cache.fetch(
+            self.auth.session, url, self.auth.user_id,
+            policy=self.auth.retry_policy, auth_headers=True)
         
-        if response.status_code != 200:
-            raise ConnectionError(f"API request failed: HTTP {response.status_code}")
+        if status_code != 200:
+            raise ConnectionError(f"API request failed: HTTP {status_code}")
             
-        return response.json()
+        return json.loads(body)
+    
+    async def make_api_request_async(self, endpoint: str) -> Any:
+        """
+        Make an API request without blocking the event loop.
+        
+        The request runs on the authenticated session in the loop's
+        default thread pool, so cookies and connection reuse are shared
+        with `make_api_request`.
+        
+        Parameters
+        ----------
+        endpoint : str
+            API endpoint to request
+            
+        Returns
+        -------
+        Any
+            JSON response from the API
+            
+        Raises
+        ------
+        ValueError
+            If authentication is not valid
+        ConnectionError
+            If the API request fails
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.make_api_request, endpoint)
+    
+    async def gather_api_requests(self, endpoints: List[str],
+                                  limit: int = DEFAULT_API_CONCURRENCY) -> List[Any]:
+        """
+        Request several endpoints concurrently.
+        
+        Parameters
+        ----------
+        endpoints : List[str]
+            API endpoints to request
+        limit : int, optional
+            Maximum number of requests in flight, by default DEFAULT_API_CONCURRENCY
+            
+        Returns
+        -------
+        List[Any]
+            JSON responses in the same order as `endpoints`
+        """
+        semaphore = asyncio.Semaphore(max(1, limit))
+        
+        async def fetch(endpoint: str) -> Any:
+            async with semaphore:
+                return await self.make_api_request_async(endpoint)
+                
+        return await asyncio.gather(*(fetch(endpoint) for endpoint in endpoints))
     
     @abstractmethod
     def fetch_data(self) -> Any:
@@ -1,11 +1,18 @@
 """
 Scraper for forum posts data.
 """
-from typing import List, Dict, Any
-import pandas as pd
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Deque, Iterable, Iterator, Optional, Tuple
+import csv
+import hashlib
+import itertools
+import json
 import os
+import shutil
 
 from src.scrapers.base import BaseScraper
+from src.utils.config import DEFAULT_API_CONCURRENCY
 
 
 class ForumsScraper(BaseScraper):
@@ -13,64 +20,266 @@ class ForumsScraper(BaseScraper):
     Scraper for course forum posts.
     """
     
-    def fetch_data(self, max_pages: int = 10) -> List[Dict[str, Any]]:
+    # Supported export file formats
+    EXPORT_FORMATS = ("csv", "jsonl")
+    
+    # Columns of the exported posts, in file order
+    EXPORT_FIELDS = ("title", "desc", "username")
+    
+    def iter_posts(self, prefetch: int = DEFAULT_API_CONCURRENCY,
+                   max_pages: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield forum posts page by page, prefetching the following pages.
+        
+        Up to `prefetch` pages are requested concurrently ahead of the page
+        being consumed. Iteration stops at the first empty page.
+        
+        Parameters
+        ----------
+        prefetch : int, optional
+            Number of pages requested ahead, by default DEFAULT_API_CONCURRENCY
+        max_pages : Optional[int], optional
+            Maximum number of pages to fetch, by default None (no limit)
+            
+        Yields
+        ------
+        Dict[str, Any]
+            Forum posts in page order
+        """
+        prefetch = max(1, prefetch)
+        pages = itertools.count(1) if max_pages is None else iter(range(1, max_pages + 1))
+        window: Deque[Tuple[int, Future]] = deque()
+        count = 0
+        
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            def request_next_page() -> None:
+                page = next(pages, None)
+                if page is not None:
+                    endpoint = f"forums/fetch/general?pager={page}"
+                    window.append((page, executor.submit(self.make_api_request, endpoint)))
+            
+            for _ in range(prefetch):
+                request_next_page()
+                
+            try:
+                while window:
+                    page, future = window.popleft()
+                    forums_data = future.result()
+                    
+                    if len(forums_data.get('data', [])) == 0:
+                        break
+                        
+                    request_next_page()
+                    for question in forums_data['data']:
+                        count += 1
+                        yield self._to_post(question)
+                        
+                    print(f"Questions so far: {count} -- page no: {page}")
+            finally:
+                # Pages past the end (or left over when the caller stops early) are not needed
+                for _, future in window:
+                    future.cancel()
+    
+    def fetch_new_posts(self, seen: Iterable[str], prefetch: int = DEFAULT_API_CONCURRENCY,
+                        max_pages: Optional[int] = None) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch the forum posts newer than the already exported ones.
+        
+        Posts come newest first, so pagination stops at the first post whose
+        key is in `seen`; later pages are never requested. If no such post
+        turns up (e.g. the remembered posts were all edited or deleted),
+        every post has been fetched and the caller should replace the
+        export instead of extending it.
+        
+        Parameters
+        ----------
+        seen : Iterable[str]
+            Keys (see `post_key`) of the newest exported posts
+        prefetch : int, optional
+            Number of pages requested ahead, by default DEFAULT_API_CONCURRENCY
+        max_pages : Optional[int], optional
+            Maximum number of pages to fetch, by default None (no limit)
+            
+        Returns
+        -------
+        Tuple[List[Dict[str, Any]], bool]
+            The posts before the first seen one, newest first, and whether
+            a seen post was found
+        """
+        seen = set(seen)
+        new_posts = []
+        for post in self.iter_posts(prefetch, max_pages):
+            if self.post_key(post) in seen:
+                return new_posts, True
+            new_posts.append(post)
+        return new_posts, False
+    
+    def fetch_data(self, max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch forum posts data.
         
         Parameters
         ----------
-        max_pages : int, optional
-            Maximum number of pages to fetch, by default 10
+        max_pages : Optional[int], optional
+            Maximum number of pages to fetch, by default None (all pages)
             
         Returns
         -------
         List[Dict[str, Any]]
             List of forum posts
         """
-        forums_questions_list = []
+        return list(self.iter_posts(max_pages=max_pages))
+    
+    @staticmethod
+    def _to_post(question: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the saved fields of a forum post.
         
-        for page in range(1, max_pages + 1):
-            endpoint = f"forums/fetch/general?pager={page}"
-            forums_data = self.make_api_request(endpoint)
+        Parameters
+        ----------
+        question : Dict[str, Any]
+            Forum post from the API
             
-            if len(forums_data.get('data', [])) > 0:
-                for question in forums_data['data']:
-                    forums_questions_list.append({
-                        'title': question.get('title', ''),
-                        'desc': question.get('description', ''),
-                        'username': question.get('username', '')
-                    })
-                    
-                print(f"Questions so far: {len(forums_questions_list)} -- page no: {page}")
-            else:
-                break
-                
-        return forums_questions_list
+        Returns
+        -------
+        Dict[str, Any]
+            Post with 'title', 'desc' and 'username'
+        """
+        return {
+            'title': question.get('title', ''),
+            'desc': question.get('description', ''),
+            'username': question.get('username', '')
+        }
         
-    def save_to_csv(self, data: List[Dict[str, Any]], output_path: str) -> str:
+    @staticmethod
+    def post_key(post: Dict[str, Any]) -> str:
         """
-        Save forum posts data to a CSV file.
+        Identify a forum post by its saved fields.
         
         Parameters
         ----------
-        data : List[Dict[str, Any]]
-            List of forum posts
+        post : Dict[str, Any]
+            Forum post as returned by `iter_posts`
+            
+        Returns
+        -------
+        str
+            SHA-1 hex digest of the post's title, description and author
+        """
+        fields = [post.get('title', ''), post.get('desc', ''), post.get('username', '')]
+        return hashlib.sha1(json.dumps(fields).encode('utf-8')).hexdigest()
+        
+    def save_posts(self, data: Iterable[Dict[str, Any]], output_path: str,
+                   file_format: str = "csv", prepend: bool = False) -> str:
+        """
+        Save forum posts data to `forums.<file_format>`.
+        
+        Posts are written one row at a time as `data` yields them, so a
+        generator such as `iter_posts` is never held in memory. The export
+        is written to a temporary file that replaces the old one only when
+        complete.
+        
+        Exports list posts newest first, like the forum itself. New posts
+        are therefore prepended to an existing export: they are written
+        first and the old rows are copied after them.
+        
+        Parameters
+        ----------
+        data : Iterable[Dict[str, Any]]
+            Forum posts
         output_path : str
-            Path to save the CSV file
+            Directory to save the file in
+        file_format : str, optional
+            One of EXPORT_FORMATS, by default "csv"
+        prepend : bool, optional
+            Put the posts in front of the rows of an existing file instead of
+            replacing it, by default False
             
         Returns
         -------
         str
-            Path to the saved CSV file
+            Path to the saved file, empty if there were no posts
         """
-        if not data:
+        if file_format not in self.EXPORT_FORMATS:
+            print(f"Unsupported forum export format: {file_format}")
+            return ""
+            
+        file_path = os.path.join(output_path, f"forums.{file_format}")
+        prepend = prepend and os.path.exists(file_path)
+        write_path = f"{file_path}.tmp"
+        
+        posts = iter(data)
+        first_post = next(posts, None)
+        if first_post is None:
             print("No forum data to save.")
             return ""
             
-        df = pd.DataFrame(data)
-        csv_path = os.path.join(output_path, "forums.csv")
+        count = 0
+        try:
+            with open(write_path, 'w', encoding='utf-8', newline='') as file:
+                if file_format == "jsonl":
+                    for post in itertools.chain([first_post], posts):
+                        file.write(json.dumps(post, ensure_ascii=False) + "\n")
+                        count += 1
+                else:
+                    writer = csv.DictWriter(file, fieldnames=self.EXPORT_FIELDS,
+                                            extrasaction='ignore', lineterminator='\n')
+                    writer.writeheader()
+                    for post in itertools.chain([first_post], posts):
+                        writer.writerow(post)
+                        count += 1
+                
+                if prepend:
+                    with open(file_path, 'r', encoding='utf-8', newline='') as old_file:
+                        if file_format == "csv":
+                            old_file.readline()  # header
+                        shutil.copyfileobj(old_file, file)
+        except BaseException:
+            if os.path.exists(write_path):
+                os.remove(write_path)
+            raise
+            
+        os.replace(write_path, file_path)
+            
+        print(f"{count} {'new ' if prepend else ''}forum posts saved to {file_path}")
         
-        df.to_csv(csv_path, index=False)
-        print(f"Forums data saved to {csv_path}")
+        return file_path
         
-        return csv_path
\ No newline at end of file
+    @staticmethod
+    def to_dataframe(data: Iterable[Dict[str, Any]]):
+        """
+        Build a pandas DataFrame of forum posts.
+        
+        pandas is an optional dependency and is only imported here.
+        
+        Parameters
+        ----------
+        data : Iterable[Dict[str, Any]]
+            Forum posts
+            
+        Returns
+        -------
+        pandas.DataFrame
+            One row per post
+        """
+        import pandas as pd
+        
+        return pd.DataFrame(list(data), columns=list(ForumsScraper.EXPORT_FIELDS))
+        
+    def save_to_csv(self, data: Iterable[Dict[str, Any]], output_path: str) -> str:
+        """
+        Save forum posts data to a CSV file.
+        
+        Parameters
+        ----------
+        data : Iterable[Dict[str, Any]]
+            Forum posts
+        output_path : str
+            Path to save the CSV file
+            
+        Returns
+        -------
+        str
+            Path to the saved CSV file
+        """
+        return self.save_posts(data, output_path, "csv")
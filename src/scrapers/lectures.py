@@ -1,7 +1,9 @@
 """
 Scraper for lecture videos and resources.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import hashlib
+import json
 
 from src.scrapers.base import BaseScraper
 from src.downloaders.base import DownloadItem
@@ -10,12 +12,26 @@ from src.downloaders.base import DownloadItem
 class LecturesScraper(BaseScraper):
     """
     Scraper for lecture videos and associated resources.
+    
+    After `fetch_data` runs, `snapshot` maps each lecture to a fingerprint of
+    its video and resource entries, for comparison on the next run.
     """
     
-    def fetch_data(self) -> Dict[str, List[Dict[str, Any]]]:
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize the scraper; arguments are passed to BaseScraper."""
+        super().__init__(*args, **kwargs)
+        self.snapshot: Dict[str, str] = {}
+    
+    def fetch_data(self, since: Optional[Dict[str, str]] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Fetch lecture data including videos and resources.
         
+        Parameters
+        ----------
+        since : Optional[Dict[str, str]], optional
+            Snapshot from a previous run; lectures whose fingerprint is
+            unchanged are left out, by default None (all lectures)
+        
         Returns
         -------
         Dict[str, List[Dict[str, Any]]]
@@ -25,9 +41,16 @@ class LecturesScraper(BaseScraper):
         
         videos_list = []
         resources_list = []
+        self.snapshot = {}
         
         if len(data) > 0:
             for i, lec in enumerate(data):
+                key = self._lecture_key(i, lec)
+                fingerprint = self._lecture_fingerprint(lec)
+                self.snapshot[key] = fingerprint
+                if since is not None and since.get(key) == fingerprint:
+                    continue
+                    
                 # Extract video
                 if self._has_video(lec):
                     video_item = self._extract_video(i, lec)
@@ -61,6 +84,47 @@ class LecturesScraper(BaseScraper):
                     
         return supp_list
     
+    def _lecture_key(self, index: int, lecture: Dict[str, Any]) -> str:
+        """
+        Get the snapshot key of a lecture.
+        
+        The position is part of the key because it is part of the video file name.
+        
+        Parameters
+        ----------
+        index : int
+            Lecture index
+        lecture : Dict[str, Any]
+            Lecture data
+            
+        Returns
+        -------
+        str
+            Snapshot key
+        """
+        return f"{index + 1}_{lecture.get('title', 'noTitle')}"
+    
+    def _lecture_fingerprint(self, lecture: Dict[str, Any]) -> str:
+        """
+        Fingerprint the downloadable entries of a lecture.
+        
+        Parameters
+        ----------
+        lecture : Dict[str, Any]
+            Lecture data
+            
+        Returns
+        -------
+        str
+            SHA-1 of the lecture's videoURL, videosUploaded and resources
+        """
+        entries = {
+            'videoURL': lecture.get('videoURL'),
+            'videosUploaded': lecture.get('videosUploaded'),
+            'resources': lecture.get('resources')
+        }
+        return hashlib.sha1(json.dumps(entries, sort_keys=True).encode('utf-8')).hexdigest()
+    
     def _has_video(self, lecture: Dict[str, Any]) -> bool:
         """
         Check if a lecture has a video.
@@ -111,7 +175,8 @@ class LecturesScraper(BaseScraper):
             'fileURL': file_url
         }
         
-    def get_download_items(self, type_name: str) -> List[DownloadItem]:
+    def get_download_items(self, type_name: str,
+                           since: Optional[Dict[str, str]] = None) -> List[DownloadItem]:
         """
         Get download items for the specified content type.
         
@@ -119,6 +184,9 @@ class LecturesScraper(BaseScraper):
         ----------
         type_name : str
             Content type: "Videos", "Resources", or "Supp"
+        since : Optional[Dict[str, str]], optional
+            Lecture snapshot from a previous run; only new or changed lectures
+            are returned, by default None. Not used for "Supp".
             
         Returns
         -------
@@ -126,10 +194,10 @@ class LecturesScraper(BaseScraper):
             List of download items
         """
         if type_name == "Videos":
-            data = self.fetch_data()
+            data = self.fetch_data(since)
             items = data['videos']
         elif type_name == "Resources":
-            data = self.fetch_data()
+            data = self.fetch_data(since)
             items = data['resources']
         elif type_name == "Supp":
             items = self.fetch_supplementary_resources()
@@ -1,11 +1,16 @@
 """
 Scraper for quiz and assignment data.
 """
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Optional, Tuple
 import json
 import os
+import queue
+import threading
 
 from src.scrapers.base import BaseScraper
+from src.utils.config import DEFAULT_API_CONCURRENCY
 
 
 class QuizAssignmentScraper(BaseScraper):
@@ -85,14 +90,43 @@ class QuizAssignmentScraper(BaseScraper):
         """
         return self.make_api_request(f"assignments/submissions/{assignment_id}")
     
-    def save_quiz_data(self, output_dir: str) -> None:
+    async def fetch_all_quiz_details_async(self, quiz_ids: List[str],
+                                           limit: int = DEFAULT_API_CONCURRENCY) -> List[Dict[str, Any]]:
+        """
+        Fetch details for several quizzes concurrently.
+        
+        Parameters
+        ----------
+        quiz_ids : List[str]
+            Quiz IDs
+        limit : int, optional
+            Maximum number of requests in flight, by default DEFAULT_API_CONCURRENCY
+            
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Quiz details in the same order as `quiz_ids`
+        """
+        return await self.gather_api_requests([f"quiz/{qid}" for qid in quiz_ids], limit)
+    
+    def save_quiz_data(self, output_dir: str, max_workers: int = DEFAULT_API_CONCURRENCY) -> bool:
         """
         Fetch and save all quiz data.
         
+        Quiz details are fetched concurrently and written to disk by a
+        separate writer stage.
+        
         Parameters
         ----------
         output_dir : str
             Directory to save quiz data
+        max_workers : int, optional
+            Maximum number of requests in flight, by default DEFAULT_API_CONCURRENCY
+            
+        Returns
+        -------
+        bool
+            True if every quiz was fetched and saved
         """
         quizzes = self.fetch_quizzes()
         
@@ -102,31 +136,38 @@ class QuizAssignmentScraper(BaseScraper):
                 {"response": f"No Quiz data Found for course {self.course.course_id}"}, 
                 os.path.join(output_dir, "quizzes-summary.json")
             )
-            return
+            return True
             
         print(f"Total Quizzes Found -- {len(quizzes)}")
         self.save_data_to_file(quizzes, os.path.join(output_dir, "quizzes-summary.json"))
         
-        for quiz in quizzes:
-            qid = quiz.get('qid')
-            if qid is not None:
-                quiz_data = self.fetch_quiz_details(qid)
-                quiz_title = self._format_title(quiz_data.get('quiz', {}).get('title', 'No-Title'))
-                
-                # Save quiz data
-                self.save_data_to_file(
-                    quiz_data, 
-                    os.path.join(output_dir, f"{quiz_title}.json")
-                )
+        def quiz_path(quiz_data: Dict[str, Any]) -> str:
+            quiz_title = self._format_title(quiz_data.get('quiz', {}).get('title', 'No-Title'))
+            return os.path.join(output_dir, f"{quiz_title}.json")
+            
+        jobs = [(f"quiz/{quiz['qid']}", quiz_path, None)
+                for quiz in quizzes if quiz.get('qid') is not None]
+        return self._fetch_and_save(jobs, max_workers) == len(jobs)
                 
-    def save_assignment_data(self, output_dir: str) -> None:
+    def save_assignment_data(self, output_dir: str, max_workers: int = DEFAULT_API_CONCURRENCY) -> bool:
         """
         Fetch and save all assignment data.
         
+        Assignment details and submissions are fetched concurrently and
+        written to disk by a separate writer stage.
+        
         Parameters
         ----------
         output_dir : str
             Directory to save assignment data
+        max_workers : int, optional
+            Maximum number of requests in flight, by default DEFAULT_API_CONCURRENCY
+            
+        Returns
+        -------
+        bool
+            True if the details and submissions of every assignment were
+            fetched and saved
         """
         assignments = self.fetch_assignments()
         
@@ -136,32 +177,93 @@ class QuizAssignmentScraper(BaseScraper):
                 {"response": f"No assignment data Found for course {self.course.course_id}"}, 
                 os.path.join(output_dir, "assignments-summary.json")
             )
-            return
+            return True
             
         print(f"Total Assignments Found -- {len(assignments)}")
         self.save_data_to_file(assignments, os.path.join(output_dir, "assignments-summary.json"))
         
+        jobs: List[Tuple[str, Callable[[Any], str], Optional[str]]] = []
         for assignment in assignments:
             aid = assignment.get('aid')
             if aid is not None:
-                # Fetch and save assignment details
-                assignment_data = self.fetch_assignment_details(aid)
                 assignment_title = self._format_title(assignment.get('title', 'No-Title'))
+                details_path = os.path.join(output_dir, f"{assignment_title}.json")
+                submission_path = os.path.join(output_dir, f"{assignment_title}_submission.json")
                 
-                self.save_data_to_file(
-                    assignment_data, 
-                    os.path.join(output_dir, f"{assignment_title}.json")
-                )
+                message = f"Dumped {assignment_title} files"
+                jobs.append((f"assignments/{aid}", lambda _, path=details_path: path, message))
+                jobs.append((f"assignments/submissions/{aid}", lambda _, path=submission_path: path,
+                             message))
                 
-                # Fetch and save submission details
-                submission_data = self.fetch_assignment_submissions(aid)
-                self.save_data_to_file(
-                    submission_data, 
-                    os.path.join(output_dir, f"{assignment_title}_submission.json")
-                )
-                
-                print(f"Dumped {assignment_title} files")
+        return self._fetch_and_save(jobs, max_workers) == len(jobs)
                 
+    def _fetch_and_save(self, jobs: List[Tuple[str, Callable[[Any], str], Optional[str]]],
+                        max_workers: int) -> int:
+        """
+        Fetch API endpoints concurrently and save each response as JSON.
+        
+        Requests run in a pool of `max_workers` threads, while a separate
+        writer thread serializes and writes the responses, so a slow JSON
+        dump never holds up the next request. Responses are handed to the
+        writer in job order through a bounded queue. A failed request or
+        write is reported and the remaining jobs carry on.
+        
+        Parameters
+        ----------
+        jobs : List[Tuple[str, Callable[[Any], str], Optional[str]]]
+            (endpoint, function giving the output path for the response,
+            message) triples. A message is printed once the files of every
+            job carrying it have been written.
+        max_workers : int
+            Maximum number of requests in flight
+            
+        Returns
+        -------
+        int
+            Number of files written, equal to ``len(jobs)`` if nothing failed
+        """
+        max_workers = max(1, max_workers)
+        write_queue: "queue.Queue[Optional[Tuple[Any, str, Optional[str]]]]" = queue.Queue(max_workers * 2)
+        written = [0]
+        
+        # Files still to be written before each message is printed
+        pending = Counter(message for _, _, message in jobs if message)
+        
+        def write_files() -> None:
+            while True:
+                job = write_queue.get()
+                if job is None:
+                    return
+                data, file_path, message = job
+                try:
+                    self.save_data_to_file(data, file_path)
+                    written[0] += 1
+                    if message:
+                        pending[message] -= 1
+                        if pending[message] == 0:
+                            print(message)
+                except Exception as e:
+                    print(f"Error saving {file_path}: {str(e)}")
+                    
+        writer = threading.Thread(target=write_files, daemon=True)
+        writer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [(endpoint, executor.submit(self.make_api_request, endpoint), path_for, message)
+                           for endpoint, path_for, message in jobs]
+                for endpoint, future, path_for, message in futures:
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        print(f"Error fetching {endpoint}: {str(e)}")
+                        continue
+                    write_queue.put((data, path_for(data), message))
+        finally:
+            write_queue.put(None)
+            writer.join()
+            
+        return written[0]
+        
     def _format_title(self, title: str) -> str:
         """
         Format a title for use in filenames.
@@ -0,0 +1,212 @@
+"""
+Persistent on-disk cache for HTTP responses.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import requests
+
+from src.utils.config import (
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_MAX_BYTES
+)
+
+if TYPE_CHECKING:
+    from src.utils.retry import RetryPolicy
+
+
+class ResponseCache:
+    """
+    On-disk cache of GET response bodies keyed by URL and user.
+    
+    Entries younger than the TTL are served without touching the network.
+    Older entries are revalidated with ``If-None-Match`` / ``If-Modified-Since``
+    when the server sent an ETag or Last-Modified header, so an unchanged
+    resource costs a single ``304 Not Modified``. The least recently used
+    entries are evicted once the cache grows beyond `max_bytes`.
+    
+    The total size of a directory is counted once per process and then
+    kept up to date on every write by any instance using that directory,
+    so it is only listed again when the budget is exceeded. Eviction then
+    goes down to EVICT_TO of the budget, which leaves room for many writes
+    before the next listing.
+    """
+    
+    EVICT_TO = 0.9
+    
+    _lock = threading.Lock()
+    # Running total size of the entries in each cache directory
+    _total_bytes: Dict[str, int] = {}
+    
+    def __init__(self, directory: str = RESPONSE_CACHE_DIR,
+                 ttl: float = RESPONSE_CACHE_TTL,
+                 max_bytes: int = RESPONSE_CACHE_MAX_BYTES):
+        """
+        Initialize the cache.
+        
+        Parameters
+        ----------
+        directory : str, optional
+            Directory holding cache entries, by default RESPONSE_CACHE_DIR
+        ttl : float, optional
+            Seconds an entry is used without revalidation, by default RESPONSE_CACHE_TTL
+        max_bytes : int, optional
+            Maximum total size of the cache, by default RESPONSE_CACHE_MAX_BYTES.
+            A value of 0 disables storing new entries.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._key = os.path.abspath(directory)
+    
+    def fetch(self, session: requests.Session, url: str, user: Optional[str] = None,
+              headers: Optional[Dict[str, str]] = None,
+              policy: Optional['RetryPolicy'] = None, auth_headers: bool = False,
+              revalidate: bool = False) -> Tuple[int, str]:
+        """
+        GET a URL through the cache.
+        
+        Parameters
+        ----------
+        session : requests.Session
+            Session used when the network has to be hit
+        url : str
+            URL to fetch
+        user : Optional[str], optional
+            Identifier of the logged-in user, part of the cache key, by default None
+        headers : Optional[Dict[str, str]], optional
+            Extra request headers, by default None
+        policy : Optional[RetryPolicy], optional
+            Retry policy the request is sent through, by default None (a single attempt)
+        auth_headers : bool, optional
+            Let `policy` add its authenticator's token headers, by default False
+        revalidate : bool, optional
+            Ask the server even if the entry is younger than the TTL,
+            by default False
+        
+        Returns
+        -------
+        Tuple[int, str]
+            HTTP status code (200 for cache hits and revalidated entries) and body
+        """
+        path = self._entry_path(url, user)
+        entry = self._load(path)
+        
+        if entry is not None and not revalidate and time.time() - entry['stored_at'] < self.ttl:
+            return 200, entry['body']
+        
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+        
+        if policy is not None:
+            response = policy.request(session, url, headers=request_headers, auth_headers=auth_headers)
+        else:
+            response = session.get(url, headers=request_headers)
+        
+        if response.status_code == 304 and entry is not None:
+            entry['stored_at'] = time.time()
+            self._store(path, entry)
+            return 200, entry['body']
+        
+        if response.status_code == 200:
+            self._store(path, {
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'stored_at': time.time(),
+                'body': response.text
+            })
+        
+        return response.status_code, response.text
+    
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._lock:
+            for _, path in self._entries():
+                self._remove(path)
+            self._total_bytes[self._key] = 0
+    
+    def _entry_path(self, url: str, user: Optional[str]) -> str:
+        """Get the file path of the entry for a URL and user."""
+        key = hashlib.sha256(f"{user or ''}\n{url}".encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def _load(self, path: str) -> Optional[Dict[str, Any]]:
+        """Read an entry, marking it as recently used."""
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+    
+    def _store(self, path: str, entry: Dict[str, Any]) -> None:
+        """Atomically write an entry and evict old ones if over budget."""
+        if self.max_bytes <= 0:
+            return
+        
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(entry, file)
+        new_size = os.path.getsize(tmp_path)
+        
+        with self._lock:
+            if self._key not in self._total_bytes:
+                self._total_bytes[self._key] = sum(stat.st_size for stat, _ in self._entries())
+            try:
+                old_size = os.path.getsize(path)
+            except OSError:
+                old_size = 0
+            os.replace(tmp_path, path)
+            self._total_bytes[self._key] += new_size - old_size
+            
+            if self._total_bytes[self._key] > self.max_bytes:
+                self._evict()
+    
+    def _evict(self) -> None:
+        """
+        Delete least recently used entries until the cache fits in EVICT_TO of
+        `max_bytes`. The caller holds `_lock`.
+        """
+        entries = sorted(self._entries(), key=lambda e: e[0].st_mtime)
+        total = sum(stat.st_size for stat, _ in entries)
+        
+        for stat, path in entries:
+            if total <= self.max_bytes * self.EVICT_TO:
+                break
+            self._remove(path)
+            total -= stat.st_size
+        self._total_bytes[self._key] = total
+    
+    def _entries(self) -> List[Tuple[os.stat_result, str]]:
+        """List (stat, path) pairs of all cache entries."""
+        if not os.path.isdir(self.directory):
+            return []
+        
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith('.json'):
+                path = os.path.join(self.directory, file_name)
+                try:
+                    entries.append((os.stat(path), path))
+                except OSError:
+                    continue
+        return entries
+    
+    @staticmethod
+    def _remove(path: str) -> None:
+        """Delete a file, ignoring entries already removed."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -2,7 +2,6 @@
 Command line interface utilities for user interaction.
 """
 from typing import List, Dict, Any, Optional, Union
-from PyInquirer import prompt
 
 from src.core.course import Course
 
@@ -34,6 +33,8 @@ def select_from_list(message: str, choices: List[str], name: str = "choice") ->
         }
     ]
     
+    from PyInquirer import prompt
+    
     answer = prompt(questions)
     return answer.get(name)
 
@@ -1,6 +1,7 @@
 """
 Configuration settings and constants for the Hello IITK downloader application.
 """
+import os
 from typing import Dict, Any
 
 # API URLs
@@ -8,6 +9,21 @@ BASE_URL = "https://hello.iitk.ac.in"
 LOGIN_URL = f"{BASE_URL}/user/login"
 COURSES_URL = f"{BASE_URL}/index.php/courses"
 
+# On-disk cache for API responses and the course list: entries younger than
+# the TTL (seconds) skip the network, older ones are revalidated with ETags
+RESPONSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "helloiitk", "responses")
+RESPONSE_CACHE_TTL = 600
+RESPONSE_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Login cookies saved between runs (readable by the owner only); a saved
+# session is reused as long as this page answers a HEAD request without a redirect
+SESSION_FILE = os.path.join(os.path.expanduser("~"), ".cache", "helloiitk", "session.json")
+SESSION_CHECK_URL = COURSES_URL
+
+# Parsed course list of each user ({} is the uid), reused for COURSE_CATALOG_TTL seconds
+COURSE_CATALOG_FILE = os.path.join(os.path.expanduser("~"), ".cache", "helloiitk", "courses-{}.json")
+COURSE_CATALOG_TTL = 24 * 60 * 60
+
 # Default options for PDF conversion
 DEFAULT_PDF_OPTIONS: Dict[str, Any] = {
     'page-size': 'Letter',
@@ -19,6 +35,15 @@ DEFAULT_PDF_OPTIONS: Dict[str, Any] = {
     'javascript-delay': '5000'  # give time to render JavaScript
 }
 
+# PDF options for pages whose math was pre-rendered: there is no JavaScript to wait for
+PRERENDERED_PDF_OPTIONS: Dict[str, Any] = {
+    **DEFAULT_PDF_OPTIONS,
+    'javascript-delay': '0'
+}
+
+# Number of quiz PDFs rendered in parallel
+DEFAULT_PDF_WORKERS = 4
+
 # Default CSS file path
 CSS_FILE = "main.css"
 
@@ -26,8 +51,74 @@ CSS_FILE = "main.css"
 QUIZ_TITLE_PREFIX = ""
 ASSIGNMENT_TITLE_PREFIX = ""
 
+# Per-course database of downloaded files, kept in the course directory
+MANIFEST_FILE_NAME = ".downloads.sqlite"
+
+# Lecture snapshot used by sync mode, one per resource type ({} is the type)
+SYNC_SNAPSHOT_FILE_NAME = ".sync-{}.json"
+
+# Newest exported forum posts, one file per export format ({} is the format)
+FORUMS_STATE_FILE_NAME = ".forums-{}.json"
+
+# Number of newest post keys remembered for incremental forum exports
+FORUMS_STATE_KEYS = 20
+
+# Number of files downloaded in parallel by the DownloadManager
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+# Attempts per file before an HTTP download is abandoned (partial data is kept)
+DEFAULT_DOWNLOAD_RETRIES = 3
+
+# Files at least this large are fetched over several connections
+# when the server accepts byte ranges
+DEFAULT_DOWNLOAD_SEGMENTS = 4
+SEGMENTED_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+
+# Read buffer bounds for HTTP downloads and how often (seconds) progress bars refresh
+MIN_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+PROGRESS_UPDATE_INTERVAL = 0.5
+
+# Maximum number of API requests in flight when a scraper fetches many items
+DEFAULT_API_CONCURRENCY = 8
+
+# Number of per-host connection pools kept by shared HTTP sessions
+HTTP_POOL_CONNECTIONS = 10
+
+# Attempts per HTTP request on connection errors and 408/429/5xx responses;
+# the backoff doubles from RETRY_BACKOFF_BASE seconds (with full jitter)
+# and never exceeds RETRY_MAX_DELAY seconds, Retry-After included
+DEFAULT_HTTP_RETRIES = 5
+RETRY_BACKOFF_BASE = 0.5
+RETRY_MAX_DELAY = 60
+
+# Per-host budget shared by all scrapers and downloads of an Authenticator:
+# requests waiting for a response at once, and new requests per second
+HOST_MAX_CONCURRENCY = 16
+HOST_MAX_REQUESTS_PER_SECOND = 20.0
+
+# Worker processes that keep a YoutubeDL instance alive between videos
+# (0 downloads in the calling thread instead)
+DEFAULT_YOUTUBE_WORKERS = 2
+
+# Fragments of one DASH/HLS video fetched at once; honoured by yt-dlp,
+# youtube_dl downloads fragments one after another
+YOUTUBE_FRAGMENT_CONCURRENCY = 4
+
+# Download rate limit per video in bytes per second (None for no limit)
+YOUTUBE_RATE_LIMIT = None
+
+# Video info (chosen format and size) found by the YouTube pre-flight,
+# reused for YOUTUBE_INFO_TTL seconds
+YOUTUBE_INFO_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "helloiitk", "youtube-info.json")
+YOUTUBE_INFO_TTL = 7 * 24 * 60 * 60
+
 # YouTube download options
 DEFAULT_YOUTUBE_OPTIONS: Dict[str, Any] = {
     'format': 'bestvideo[height<=480]+bestaudio/best[height<=480]',
-    'vcodec': 'avc1.4d401e'
+    'vcodec': 'avc1.4d401e',
+    'concurrent_fragment_downloads': YOUTUBE_FRAGMENT_CONCURRENCY,
+    'ratelimit': YOUTUBE_RATE_LIMIT,
+    'retries': 10,
+    'fragment_retries': 10
 }
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+HTTP session helpers shared by scrapers and downloaders.
+"""
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.config import HTTP_POOL_CONNECTIONS
+
+
+def build_session(pool_size: int,
+                  session: Optional[requests.Session] = None,
+                  headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Prepare a session with a connection pool sized for concurrent use.
+    
+    Connections are kept alive and reused across requests to the same host,
+    so repeated downloads skip the TCP and TLS handshakes.
+    
+    Parameters
+    ----------
+    pool_size : int
+        Maximum number of connections kept open per host
+    session : Optional[requests.Session], optional
+        Existing session to tune (e.g. the authenticated one), by default None
+        (a new session is created)
+    headers : Optional[Dict[str, str]], optional
+        Headers to send with every request, by default None
+    
+    Returns
+    -------
+    requests.Session
+        The tuned session
+    """
+    session = session or requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=max(1, pool_size)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
+    if headers:
+        session.headers.update(headers)
+    
+    return session
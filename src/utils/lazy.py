@@ -0,0 +1,33 @@
+"""
+Lazy attribute loading for package namespaces.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def lazy_getattr(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module-level ``__getattr__`` that imports exports on first access.
+    
+    Parameters
+    ----------
+    package : str
+        Name of the package the function is installed in
+    exports : Dict[str, str]
+        Exported names mapped to the modules defining them
+    
+    Returns
+    -------
+    Callable[[str], Any]
+        Function to assign to the package's ``__getattr__``
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name]), name)
+        # Later lookups find the name directly
+        setattr(sys.modules[package], name, value)
+        return value
+    
+    return __getattr__
@@ -0,0 +1,227 @@
+"""
+Retry policy shared by the API scrapers and the HTTP downloader.
+"""
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+import requests
+
+from src.utils.config import (
+    BASE_URL,
+    DEFAULT_HTTP_RETRIES,
+    RETRY_BACKOFF_BASE,
+    RETRY_MAX_DELAY,
+    HOST_MAX_CONCURRENCY,
+    HOST_MAX_REQUESTS_PER_SECOND
+)
+
+if TYPE_CHECKING:
+    from src.core.auth import Authenticator
+
+
+class RetryPolicy:
+    """
+    Send requests with retries, re-authentication and a per-host budget.
+    
+    Connection errors and responses with a status in RETRY_STATUSES are
+    retried after an exponential backoff with full jitter, or after the
+    delay asked for in a ``Retry-After`` header. On ``401``/``403`` from
+    AUTH_HOST the policy logs in again through its authenticator (once per
+    request) and repeats the request with the new tokens; other hosts do not
+    know our session, so their refusals are returned as they are.
+    
+    Every host gets at most `host_concurrency` requests waiting for a
+    response at once and at most `host_rate` new requests per second.
+    For streamed responses the concurrency slot is released as soon as the
+    headers arrive.
+    """
+    
+    RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+    AUTH_STATUSES = frozenset({401, 403})
+    AUTH_HOST = urlsplit(BASE_URL).netloc.lower()
+    
+    def __init__(self, auth: Optional['Authenticator'] = None,
+                 max_attempts: int = DEFAULT_HTTP_RETRIES,
+                 backoff_base: float = RETRY_BACKOFF_BASE,
+                 max_delay: float = RETRY_MAX_DELAY,
+                 host_concurrency: int = HOST_MAX_CONCURRENCY,
+                 host_rate: Optional[float] = HOST_MAX_REQUESTS_PER_SECOND):
+        """
+        Initialize the policy.
+        
+        Parameters
+        ----------
+        auth : Optional[Authenticator], optional
+            Authenticator used to log in again on 401/403, by default None
+            (authentication errors are returned as they are)
+        max_attempts : int, optional
+            Attempts per request, by default DEFAULT_HTTP_RETRIES
+        backoff_base : float, optional
+            Backoff before the first retry in seconds, doubled for every
+            further retry, by default RETRY_BACKOFF_BASE
+        max_delay : float, optional
+            Longest wait between attempts in seconds, by default RETRY_MAX_DELAY
+        host_concurrency : int, optional
+            Requests waiting for a response per host, by default HOST_MAX_CONCURRENCY
+        host_rate : Optional[float], optional
+            New requests per second per host, by default HOST_MAX_REQUESTS_PER_SECOND.
+            None disables rate limiting.
+        """
+        self.auth = auth
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.max_delay = max_delay
+        self.host_concurrency = max(1, host_concurrency)
+        self.host_rate = host_rate
+        
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_next_start: Dict[str, float] = {}
+    
+    def request(self, session: requests.Session, url: str, method: str = "GET",
+                headers: Optional[Dict[str, str]] = None, auth_headers: bool = False,
+                **kwargs) -> requests.Response:
+        """
+        Send a request, retrying it as needed.
+        
+        Parameters
+        ----------
+        session : requests.Session
+            Session to send the request with
+        url : str
+            URL to request
+        method : str, optional
+            HTTP method, by default "GET"
+        headers : Optional[Dict[str, str]], optional
+            Request headers, by default None
+        auth_headers : bool, optional
+            Add the authenticator's token headers, refreshed for every
+            attempt, by default False
+        **kwargs
+            Further arguments for `requests.Session.request`, e.g. ``stream``
+        
+        Returns
+        -------
+        requests.Response
+            The final response, which may still be an error response once
+            the attempts are used up
+        
+        Raises
+        ------
+        requests.RequestException
+            If the last attempt failed to connect
+        """
+        reauthenticated = False
+        attempt = 1
+        while True:
+            request_headers = dict(headers or {})
+            token = None
+            if self.auth is not None:
+                token = self.auth.cookies.get('token')
+                if auth_headers:
+                    request_headers.update(self.auth.headers)
+            
+            try:
+                with self._host_budget(url):
+                    response = session.request(method, url, headers=request_headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_attempts:
+                    raise
+                self._sleep(attempt)
+                attempt += 1
+                continue
+            
+            if (response.status_code in self.AUTH_STATUSES and self.auth is not None
+                    and not reauthenticated and urlsplit(url).netloc.lower() == self.AUTH_HOST):
+                reauthenticated = True
+                if self.auth.relogin(token):
+                    response.close()
+                    continue
+                return response
+            
+            if response.status_code in self.RETRY_STATUSES and attempt < self.max_attempts:
+                retry_after = self._retry_after(response)
+                response.close()
+                self._sleep(attempt, retry_after)
+                attempt += 1
+                continue
+            
+            return response
+    
+    def backoff(self, attempt: int) -> float:
+        """
+        Get a randomized backoff delay.
+        
+        Parameters
+        ----------
+        attempt : int
+            Number of the attempt that just failed, starting at 1
+        
+        Returns
+        -------
+        float
+            Seconds to wait, uniform between 0 and the exponential bound
+        """
+        bound = min(self.max_delay, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, bound)
+    
+    def _sleep(self, attempt: int, retry_after: Optional[float] = None) -> None:
+        """Wait before the next attempt."""
+        delay = retry_after if retry_after is not None else self.backoff(attempt)
+        time.sleep(min(self.max_delay, max(0.0, delay)))
+    
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Parse the Retry-After header of a response.
+        
+        Parameters
+        ----------
+        response : requests.Response
+            The response
+        
+        Returns
+        -------
+        Optional[float]
+            Seconds to wait, None if the header is missing or invalid
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    
+    @contextmanager
+    def _host_budget(self, url: str) -> Iterator[None]:
+        """
+        Hold one of the host's concurrency slots, respecting its request rate.
+        
+        Parameters
+        ----------
+        url : str
+            URL about to be requested
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.host_concurrency)
+        
+        with slot:
+            if self.host_rate:
+                with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._host_next_start.get(host, now))
+                    self._host_next_start[host] = start + 1 / self.host_rate
+                time.sleep(start - now)
+            yield
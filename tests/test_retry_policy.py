@@ -0,0 +1,261 @@
+"""
+Tests for the retry policy against a local server that injects failures.
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from src.core import auth as auth_module
+from src.core.auth import Authenticator, Credentials
+from src.utils.retry import RetryPolicy
+
+
+class FakeServer(ThreadingHTTPServer):
+    """Local server whose handler fails requests as each test asks."""
+    
+    daemon_threads = True
+    
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeHandler)
+        self.lock = threading.Lock()
+        self.hits = {}
+        self.logins = 0
+        self.token = None
+        self.failures = {}
+        self.active = 0
+        self.max_active = 0
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+    
+    def hit(self, path: str) -> int:
+        with self.lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+            return self.hits[path]
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+    
+    - ``/flaky``: fails with ``server.failures['/flaky']`` 502s, then succeeds
+    - ``/busy``: one 503 with ``Retry-After: 1``, then succeeds
+    - ``/down``: always 502
+    - ``/slow``: succeeds after 0.2 s, counting requests served at once
+    - ``/user/login``: issues a new token cookie
+    - ``/courses``: 200 for the current token, else a redirect to the login
+    - ``/file``: 200 for the current token cookie, else 403
+    - ``/api``: 200 for the current token header, else 401
+    - ``/forbidden``: always 403, whatever the token
+    """
+    
+    def log_message(self, *args):
+        pass
+    
+    def reply(self, status: int, headers=None, body: bytes = b"ok"):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+    
+    def cookie_token(self):
+        for part in self.headers.get("Cookie", "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == "token":
+                return value
+        return None
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server = self.server
+        with server.lock:
+            server.logins += 1
+            server.token = f"t{server.logins}"
+            token = server.token
+        self.send_response(302)
+        self.send_header("Set-Cookie", "uid=7; Path=/")
+        self.send_header("Set-Cookie", f"token={token}; Path=/")
+        self.send_header("Location", "/courses")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+    
+    def do_HEAD(self):
+        self.do_GET()
+    
+    def do_GET(self):
+        server = self.server
+        path = urlsplit(self.path).path
+        count = server.hit(path)
+        
+        if path == "/flaky":
+            if count <= server.failures.get(path, 0):
+                return self.reply(502)
+            return self.reply(200)
+        if path == "/busy":
+            if count == 1:
+                return self.reply(503, {"Retry-After": "1"})
+            return self.reply(200)
+        if path == "/down":
+            return self.reply(502)
+        if path == "/slow":
+            with server.lock:
+                server.active += 1
+                server.max_active = max(server.max_active, server.active)
+            time.sleep(0.2)
+            with server.lock:
+                server.active -= 1
+            return self.reply(200)
+        if path == "/courses":
+            if server.token and self.cookie_token() == server.token:
+                return self.reply(200)
+            return self.reply(302, {"Location": "/user/login"})
+        if path == "/file":
+            if server.token and self.cookie_token() == server.token:
+                return self.reply(200)
+            return self.reply(403)
+        if path == "/api":
+            if server.token and self.headers.get("token") == server.token:
+                return self.reply(200)
+            return self.reply(401)
+        if path == "/forbidden":
+            return self.reply(403)
+        return self.reply(404)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Start a fake server and point login, session checks and re-login at it."""
+    fake = FakeServer()
+    thread = threading.Thread(target=fake.serve_forever, daemon=True)
+    thread.start()
+    
+    monkeypatch.setattr(auth_module, "LOGIN_URL", f"{fake.url}/user/login")
+    monkeypatch.setattr(auth_module, "SESSION_CHECK_URL", f"{fake.url}/courses")
+    monkeypatch.setattr(RetryPolicy, "AUTH_HOST", urlsplit(fake.url).netloc)
+    try:
+        yield fake
+    finally:
+        fake.shutdown()
+        fake.server_close()
+
+
+@pytest.fixture
+def auth(server):
+    """Authenticator logged in to the fake server, with fast retries."""
+    authenticator = Authenticator(session_file=None)
+    authenticator.retry_policy = RetryPolicy(auth=authenticator, backoff_base=0.01, host_rate=None)
+    assert authenticator.login(Credentials("user", "secret"))
+    assert server.logins == 1
+    return authenticator
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    """Get a policy that retries without noticeable backoff or rate limit."""
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("host_rate", None)
+    return RetryPolicy(**kwargs)
+
+
+def test_retries_server_errors_until_success(server):
+    server.failures["/flaky"] = 2
+    
+    response = fast_policy().request(requests.Session(), f"{server.url}/flaky")
+    
+    assert response.status_code == 200
+    assert server.hits["/flaky"] == 3
+
+
+def test_waits_as_long_as_retry_after_asks(server):
+    start = time.monotonic()
+    response = fast_policy().request(requests.Session(), f"{server.url}/busy")
+    
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.9
+    assert server.hits["/busy"] == 2
+
+
+def test_returns_the_last_error_once_attempts_are_used_up(server):
+    response = fast_policy(max_attempts=3).request(requests.Session(), f"{server.url}/down")
+    
+    assert response.status_code == 502
+    assert server.hits["/down"] == 3
+
+
+def test_renews_an_expired_api_token_once(server, auth):
+    server.token = "expired-on-the-server"
+    
+    response = auth.retry_policy.request(auth.session, f"{server.url}/api", auth_headers=True)
+    
+    assert response.status_code == 200
+    assert server.logins == 2
+    assert server.hits["/api"] == 2
+
+
+def test_concurrent_requests_with_an_expired_session_log_in_once(server, auth):
+    server.token = "expired-on-the-server"
+    statuses = []
+    
+    def download():
+        response = auth.retry_policy.request(auth.session, f"{server.url}/file")
+        statuses.append(response.status_code)
+    
+    threads = [threading.Thread(target=download) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert statuses == [200] * 6
+    assert server.logins == 2
+
+
+def test_genuine_refusal_does_not_log_in(server, auth):
+    response = auth.retry_policy.request(auth.session, f"{server.url}/forbidden")
+    
+    assert response.status_code == 403
+    assert server.logins == 1
+    assert server.hits["/forbidden"] == 1
+
+
+def test_refusal_from_another_host_does_not_log_in(server, auth, monkeypatch):
+    server.token = "expired-on-the-server"
+    monkeypatch.setattr(RetryPolicy, "AUTH_HOST", "hello.iitk.ac.in")
+    
+    response = auth.retry_policy.request(auth.session, f"{server.url}/file")
+    
+    assert response.status_code == 403
+    assert server.logins == 1
+
+
+def test_caps_requests_in_flight_per_host(server):
+    policy = fast_policy(host_concurrency=2)
+    session = requests.Session()
+    threads = [threading.Thread(target=policy.request, args=(session, f"{server.url}/slow"))
+               for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert server.hits["/slow"] == 6
+    assert server.max_active == 2
+
+
+def test_spreads_requests_over_the_host_rate(server):
+    policy = fast_policy(host_rate=50)
+    session = requests.Session()
+    
+    start = time.monotonic()
+    for _ in range(20):
+        policy.request(session, f"{server.url}/flaky")
+    
+    # 20 starts 1/50 s apart take at least 19/50 s
+    assert time.monotonic() - start >= 0.37
@@ -0,0 +1,72 @@
+"""
+Tests for the YouTube downloader's worker pool.
+"""
+import os
+import textwrap
+
+from src.downloaders.base import DownloadItem
+from src.downloaders.manager import DownloadManager
+from src.downloaders.youtube import YouTubeDownloader
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stand-in for youtube_dl that writes the URL to the output template
+FAKE_YOUTUBE_DL = '''
+class YoutubeDL:
+    def __init__(self, params):
+        self.params = params
+    
+    def download(self, urls):
+        with open(self.params['outtmpl'], 'w') as file:
+            file.write(urls[0])
+'''
+
+
+def test_batch_downloads_land_in_each_course_directory(tmp_path, monkeypatch):
+    """
+    One downloader serves several courses, as in BatchApplication, which
+    changes directory between jobs after the worker pool has started.
+    """
+    fake_modules = tmp_path / "fake_modules"
+    fake_modules.mkdir()
+    (fake_modules / "youtube_dl.py").write_text(textwrap.dedent(FAKE_YOUTUBE_DL))
+    # Spawned workers start with the parent's sys.path, so both must be absolute
+    monkeypatch.syspath_prepend(str(fake_modules))
+    monkeypatch.syspath_prepend(REPO_ROOT)
+    
+    downloader = YouTubeDownloader(workers=1, info_cache_file=None)
+    try:
+        for course_id in ("ee100", "ta201"):
+            videos_dir = tmp_path / course_id / "Videos"
+            videos_dir.mkdir(parents=True)
+            monkeypatch.chdir(videos_dir)
+            
+            url = f"https://www.youtube.com/watch?v={course_id}"
+            assert downloader.download(DownloadItem("lecture-1.mp4", url))
+            assert (videos_dir / "lecture-1.mp4").read_text() == url
+    finally:
+        downloader.close()
+
+
+def test_download_manager_close_stops_the_workers(tmp_path, monkeypatch):
+    """DownloadManager.close shuts down the YouTube worker processes."""
+    fake_modules = tmp_path / "fake_modules"
+    fake_modules.mkdir()
+    (fake_modules / "youtube_dl.py").write_text(textwrap.dedent(FAKE_YOUTUBE_DL))
+    monkeypatch.syspath_prepend(str(fake_modules))
+    monkeypatch.syspath_prepend(REPO_ROOT)
+    monkeypatch.chdir(tmp_path)
+    
+    manager = DownloadManager(max_workers=2)
+    youtube = next(d for d in manager.downloaders if isinstance(d, YouTubeDownloader))
+    youtube.info_cache_file = None
+    
+    url = "https://www.youtube.com/watch?v=ee100"
+    assert manager.download_item(DownloadItem("lecture-1.mp4", url))
+    workers = list(youtube._pool._processes.values())
+    assert workers and all(worker.is_alive() for worker in workers)
+    
+    manager.close()
+    
+    assert youtube._pool is None
+    assert not any(worker.is_alive() for worker in workers)